@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -26,6 +27,11 @@ def main() -> None:
         action="store_true",
         help="Process documents in parallel (faster for multiple docs)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate documents even if their output is up to date",
+    )
     args = parser.parse_args()
 
     config_path = Path(args.config)
@@ -33,11 +39,18 @@ def main() -> None:
         print(f"[ERROR] Config file not found: {config_path}")
         sys.exit(1)
 
-    success = run_pipeline(config_path, dry_run=args.dry_run, parallel=args.parallel)
+    success = run_pipeline(
+        config_path,
+        dry_run=args.dry_run,
+        parallel=args.parallel,
+        force=args.force,
+    )
     sys.exit(0 if success else 1)
 
 
 if __name__ == "__main__":
+    # Parallel mode uses worker processes; needed for frozen Windows builds
+    multiprocessing.freeze_support()
     main()
 
 
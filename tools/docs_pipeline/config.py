@@ -24,6 +24,16 @@ class DocumentConfig:
     metadata: Optional[Dict[str, Any]] = None  # Document-specific metadata (overrides workspace defaults)
 
 
+@dataclass(frozen=True)
+class ConversionTask:
+    """A fully resolved document conversion (picklable for worker processes)."""
+    input: Path
+    output: Path
+    format: str  # pdf | docx | html
+    profile: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None  # Workspace defaults merged with document metadata
+
+
 @dataclass
 class WorkspaceConfig:
     name: str
@@ -7,14 +7,19 @@ Now uses direct library imports instead of subprocess calls for better performan
 """
 from __future__ import annotations
 
+import hashlib
+import importlib
+import multiprocessing
 import os
+import sys
 from pathlib import Path
-from typing import Any, Dict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
 
 import yaml
 
-from .config import PipelineConfig, WorkspaceConfig, DiagramConfig, DocumentConfig
+from .config import PipelineConfig, WorkspaceConfig, DiagramConfig, DocumentConfig, ConversionTask
 from tools.structurizr.structurizr_tools import export_workspace
 
 # Import PDF converters directly (no subprocess!)
@@ -136,14 +141,155 @@ def _convert_document(
         return False
 
 
-def run_pipeline(config_path: Path, dry_run: bool = False, parallel: bool = False) -> bool:
+def _build_task(ws: WorkspaceConfig, doc: DocumentConfig) -> ConversionTask:
+    """
+    Resolve a document entry into a conversion task.
+
+    The output defaults to the input path with the format's suffix, and
+    workspace default metadata is merged under the document's own (document wins).
+    """
+    fmt = doc.format or "pdf"
+    if doc.output is not None:
+        output = doc.output
+    else:
+        output = doc.input.with_suffix(f".{fmt}")
+
+    merged_metadata = {}
+    if ws.defaults:
+        merged_metadata.update(ws.defaults)
+    if doc.metadata:
+        merged_metadata.update(doc.metadata)
+
+    return ConversionTask(
+        input=doc.input,
+        output=output,
+        format=fmt,
+        profile=doc.profile,
+        metadata=merged_metadata if merged_metadata else None,
+    )
+
+
+def _run_task(task: ConversionTask) -> bool:
+    """Convert one task (top-level so worker processes can run it)."""
+    return _convert_document(
+        md_file=task.input,
+        output=task.output,
+        fmt=task.format,
+        profile=task.profile,
+        metadata=task.metadata,
+    )
+
+
+# PDF renderer modules, importable once tools.pdf.core has set up sys.path
+_RENDERER_MODULES = ("renderers", "renderers.playwright_renderer")
+
+
+def _worker_init() -> None:
+    """
+    Prime per-process caches in a conversion worker.
+
+    External tool discovery is remembered per wrapper class, so resolving
+    Pandoc and Mermaid CLI here means every document the worker converts
+    reuses the located executables instead of searching on first use.
+    """
+    # tools.pdf.core puts tools/pdf on sys.path; the steps import from there
+    from external_tools import PandocExecutor, MermaidCLI, ToolNotFoundError
+
+    for tool in (PandocExecutor, MermaidCLI):
+        try:
+            tool()
+        except ToolNotFoundError:
+            pass  # Reported by the conversion step that needs it
+
+    # The PDF step imports the renderer lazily; load it (and Playwright)
+    # now unless the forkserver already did
+    for module in _RENDERER_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Create the worker pool for parallel document conversion.
+
+    Conversion is largely GIL-bound Python work (markdown processing, YAML,
+    HTML post-processing), so documents run in separate processes rather
+    than threads. On Linux a forkserver preloads the converter and renderer
+    modules once so each worker doesn't pay the import cost again.
+    """
+    mp_context = None
+    if sys.platform.startswith("linux"):
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload(["tools.pdf.core", *_RENDERER_MODULES])
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_worker_init,
+    )
+
+
+def _diagram_digest(ws: WorkspaceConfig) -> Optional[str]:
+    """
+    Content hash of a workspace's exported diagrams.
+
+    The diagram export rewrites every file on each run, so their mtimes
+    can't tell whether anything actually changed; their contents can.
+    """
+    if not (ws.diagrams and ws.diagrams.output_dir.is_dir()):
+        return None
+    output_dir = ws.diagrams.output_dir
+    digest = hashlib.sha256()
+    for path in sorted(p for p in output_dir.rglob("*") if p.is_file()):
+        digest.update(path.relative_to(output_dir).as_posix().encode("utf-8") + b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _dependency_mtime(config_path: Path, ws: WorkspaceConfig) -> float:
+    """
+    Newest modification time among the inputs shared by a workspace's documents.
+
+    That is the pipeline config itself (document options and metadata live
+    there) and any exported diagrams the documents may embed.
+    """
+    newest = config_path.stat().st_mtime
+    if ws.diagrams and ws.diagrams.output_dir.is_dir():
+        for path in ws.diagrams.output_dir.rglob("*"):
+            if path.is_file():
+                newest = max(newest, path.stat().st_mtime)
+    return newest
+
+
+def _is_up_to_date(task: ConversionTask, dependency_mtime: float) -> bool:
+    """True if the task's output is newer than its input and shared dependencies."""
+    try:
+        output_mtime = os.stat(task.output).st_mtime
+        input_mtime = os.stat(task.input).st_mtime
+    except OSError:
+        return False
+    return output_mtime >= max(input_mtime, dependency_mtime)
+
+
+def run_pipeline(
+    config_path: Path,
+    dry_run: bool = False,
+    parallel: bool = False,
+    force: bool = False,
+) -> bool:
     """
     Run the documentation pipeline described by the given YAML config.
 
+    Documents whose output is newer than the Markdown source, the config
+    file and the workspace's exported diagrams are skipped (make-style),
+    unless force is set.
+
     Args:
         config_path: Path to YAML configuration file
         dry_run: If True, show what would be generated without actually running
         parallel: If True, process documents in parallel (faster for multiple docs)
+        force: If True, regenerate documents even if their output is up to date
 
     Example config:
 
@@ -172,6 +318,13 @@ def run_pipeline(config_path: Path, dry_run: bool = False, parallel: bool = Fals
     for ws in cfg.workspaces:
         print(f"[WORKSPACE] {ws.name}")
 
+        # Snapshot the shared dependencies before the diagram export below
+        # touches every exported file
+        check_up_to_date = bool(ws.documents) and not force
+        if check_up_to_date:
+            dependency_mtime = _dependency_mtime(config_path, ws)
+            diagrams_before = _diagram_digest(ws)
+
         # 1. Diagrams
         if ws.diagrams:
             print(f"   [DIAGRAMS] Generating diagrams ({', '.join(ws.diagrams.formats)})...")
@@ -222,77 +375,72 @@ def run_pipeline(config_path: Path, dry_run: bool = False, parallel: bool = Fals
 
         # 2. Documents
         if ws.documents:
-            print(f"   [DOCUMENTS] Converting {len(ws.documents)} documents...")
-            
+            tasks = [_build_task(ws, doc) for doc in ws.documents]
+            skipped = []
+            if check_up_to_date:
+                if _diagram_digest(ws) != diagrams_before:
+                    # The export changed the diagrams: every document is stale
+                    dependency_mtime = _dependency_mtime(config_path, ws)
+                stale = []
+                for task in tasks:
+                    if _is_up_to_date(task, dependency_mtime):
+                        skipped.append(task)
+                    else:
+                        stale.append(task)
+                tasks = stale
+
+            print(f"   [DOCUMENTS] Converting {len(tasks)} documents...")
+            for task in skipped:
+                print(f"      [SKIP] {task.input.name} (up to date)")
+
             if parallel and not dry_run:
                 # Parallel execution with configurable worker count
                 max_workers = int(os.getenv('PIPELINE_WORKERS', os.cpu_count() or 4))
-                with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = {}
-                    for doc in ws.documents:
-                        md_file = doc.input
-                        if doc.output is not None:
-                            output = doc.output
-                        else:
-                            suffix = ".pdf" if (doc.format or "pdf") == "pdf" else f".{doc.format}"
-                            output = md_file.with_suffix(suffix)
-                        
-                        # Merge workspace defaults with document metadata (document wins)
-                        merged_metadata = {}
-                        if ws.defaults:
-                            merged_metadata.update(ws.defaults)
-                        if doc.metadata:
-                            merged_metadata.update(doc.metadata)
-                        
-                        future = executor.submit(
-                            _convert_document,
-                            md_file,
-                            output,
-                            doc.format or 'pdf',
-                            doc.profile,
-                            merged_metadata if merged_metadata else None,
-                        )
-                        futures[future] = (doc, output)
-                    
-                    # Collect results as they complete
-                    for i, future in enumerate(as_completed(futures), 1):
-                        doc, output = futures[future]
-                        ok = future.result()
-                        status = "[OK]" if ok else "[FAIL]"
-                        print(f"      {status} [{i}/{len(ws.documents)}] {doc.input.name}")
-                        all_ok = all_ok and ok
+                max_pending = max_workers * 2
+                with _process_pool(max_workers) as executor:
+                    # Keep a bounded number of tasks in flight, topping up
+                    # as results come in, instead of submitting everything
+                    pending: Dict[Future, ConversionTask] = {}
+                    remaining = iter(tasks)
+                    completed = 0
+                    while True:
+                        for task in islice(remaining, max_pending - len(pending)):
+                            try:
+                                future = executor.submit(_run_task, task)
+                            except Exception as e:
+                                # The pool broke after an earlier crash; fail
+                                # this document through the same path below
+                                future = Future()
+                                future.set_exception(e)
+                            pending[future] = task
+                        if not pending:
+                            break
+
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            task = pending.pop(future)
+                            completed += 1
+                            try:
+                                ok = future.result()
+                            except Exception as e:
+                                # A crashed worker fails its document, not the run
+                                print(f"      [ERROR] {task.input.name}: {e}")
+                                ok = False
+                            status = "[OK]" if ok else "[FAIL]"
+                            print(f"      {status} [{completed}/{len(tasks)}] {task.input.name}")
+                            all_ok = all_ok and ok
             else:
                 # Sequential execution
-                for i, doc in enumerate(ws.documents, 1):
-                    md_file = doc.input
-                    if doc.output is not None:
-                        output = doc.output
-                    else:
-                        suffix = ".pdf" if (doc.format or "pdf") == "pdf" else f".{doc.format}"
-                        output = md_file.with_suffix(suffix)
-
-                    # Merge workspace defaults with document metadata (document wins)
-                    merged_metadata = {}
-                    if ws.defaults:
-                        merged_metadata.update(ws.defaults)
-                    if doc.metadata:
-                        merged_metadata.update(doc.metadata)
-
+                for i, task in enumerate(tasks, 1):
                     if dry_run:
-                        print(f"      [DRY RUN] Would convert: {md_file.name} -> {output.name}")
-                        if merged_metadata:
-                            print(f"      [DRY RUN] Metadata: {merged_metadata}")
+                        print(f"      [DRY RUN] Would convert: {task.input.name} -> {task.output.name}")
+                        if task.metadata:
+                            print(f"      [DRY RUN] Metadata: {task.metadata}")
                         ok = True
                     else:
-                        ok = _convert_document(
-                            md_file=md_file,
-                            output=output,
-                            fmt=doc.format or 'pdf',
-                            profile=doc.profile,
-                            metadata=merged_metadata if merged_metadata else None,
-                        )
+                        ok = _run_task(task)
                     status = "[OK]" if ok else "[FAIL]"
-                    print(f"      {status} [{i}/{len(ws.documents)}] {doc.input.name}")
+                    print(f"      {status} [{i}/{len(tasks)}] {task.input.name}")
                     all_ok = all_ok and ok
 
         print()  # Blank line between workspaces
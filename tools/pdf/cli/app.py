@@ -9,7 +9,9 @@ Usage:
     python -m tools.pdf.cli.app diag phase-b
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional, List
 from enum import Enum
@@ -225,6 +227,38 @@ def convert(
         raise typer.Exit(1)
 
 
+def _convert_file(input_file: str, output_file: str, format_value: str, config: dict):
+    """
+    Convert one file for `batch`.
+    
+    Returns:
+        (success, error message or None)
+    """
+    converter = {
+        OutputFormat.pdf.value: markdown_to_pdf,
+        OutputFormat.docx.value: markdown_to_docx,
+    }.get(format_value, markdown_to_html)
+    try:
+        return bool(converter(input_file, output_file, **config)), None
+    except Exception as e:
+        return False, str(e)
+
+
+# (format value, converter config) shared by every file of a batch; set once
+# per worker process by _init_batch_worker instead of pickled with each task
+_batch_options = None
+
+
+def _init_batch_worker(format_value: str, config: dict) -> None:
+    global _batch_options
+    _batch_options = (format_value, config)
+
+
+def _convert_batch_file(input_file: str, output_file: str):
+    """Worker entry point: _convert_file() with the batch-wide options."""
+    return _convert_file(input_file, output_file, *_batch_options)
+
+
 @app.command()
 def batch(
     input_files: List[str] = typer.Argument(..., help="Input Markdown files (glob patterns supported)"),
@@ -232,6 +266,7 @@ def batch(
     profile: Optional[str] = typer.Option(None, "--profile", "-p", help="Style profile"),
     output_dir: Optional[str] = typer.Option(None, "--output-dir", "-o", help="Output directory"),
     use_native_renderer: bool = typer.Option(True, "--native/--no-native", help="Use Phase B native renderer"),
+    jobs: Optional[int] = typer.Option(None, "--jobs", "-j", min=1, help="Parallel worker processes (default: CPU count)"),
     verbose: Verbosity = typer.Option(Verbosity.normal, "--verbose", "-v", help="Logging level"),
 ):
     """
@@ -246,6 +281,9 @@ def batch(
         
         # Use Phase B for faster rendering
         docs-pipeline batch docs/**/*.md --native
+        
+        # Convert one file at a time
+        docs-pipeline batch docs/**/*.md --jobs 1
     """
     setup_logging(verbose)
     
@@ -258,14 +296,18 @@ def batch(
         else:
             resolved_files.append(pattern)
     
-    # Validate files
+    # Validate files (a file matched by several patterns is converted once)
     valid_files = []
+    seen = set()
     for file in resolved_files:
         path = Path(file)
-        if path.exists():
-            valid_files.append(path)
-        else:
+        if not path.exists():
             console.print(f"[yellow]⚠ Skipped (not found): {file}[/yellow]")
+            continue
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            valid_files.append(path)
     
     if not valid_files:
         error_hint("No valid input files", "Could not find any matching files", "Check glob patterns and paths")
@@ -284,33 +326,69 @@ def batch(
     success_count = 0
     failed_files = []
     
+    # Every output lands in the same directory; create it once up front
+    out_dir = Path(output_dir or ".")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    suffix = f".{format.value}"
+    
+    outputs = [out_dir / (input_path.stem + suffix) for input_path in valid_files]
+    
+    # Files sharing a stem would overwrite each other's output (concurrently,
+    # with parallel workers), so refuse instead of producing one of them
+    by_output = {}
+    for input_path, output_path in zip(valid_files, outputs):
+        by_output.setdefault(output_path, []).append(input_path)
+    collisions = {out: ins for out, ins in by_output.items() if len(ins) > 1}
+    if collisions:
+        details = "; ".join(
+            f"{', '.join(str(p) for p in ins)} → {out}" for out, ins in collisions.items()
+        )
+        error_hint(
+            "Output file collision",
+            f"Several inputs would write the same output: {details}",
+            "Rename the inputs or convert them in separate batches with different --output-dir"
+        )
+        raise typer.Exit(1)
+    
+    workers = min(jobs or os.cpu_count() or 1, len(valid_files))
+    
     with Progress(console=console) as progress:
         task = progress.add_task("Converting...", total=len(valid_files))
         
-        for input_path in valid_files:
-            output_path = Path(output_dir or ".") / input_path.with_suffix(f".{format.value}").name
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                if format == OutputFormat.pdf:
-                    success = markdown_to_pdf(str(input_path), str(output_path), **config)
-                elif format == OutputFormat.docx:
-                    success = markdown_to_docx(str(input_path), str(output_path), **config)
-                else:
-                    success = markdown_to_html(str(input_path), str(output_path), **config)
-                
-                if success:
-                    success_count += 1
-                    progress.console.print(f"[green]✓[/green] {input_path.name} → {output_path.name}")
-                else:
-                    failed_files.append(str(input_path))
-                    progress.console.print(f"[red]✗[/red] {input_path.name}")
-            
-            except Exception as e:
+        def report(input_path: Path, output_path: Path, success: bool, error: Optional[str]):
+            nonlocal success_count
+            if success:
+                success_count += 1
+                progress.console.print(f"[green]✓[/green] {input_path.name} → {output_path.name}")
+            else:
                 failed_files.append(str(input_path))
-                progress.console.print(f"[red]✗[/red] {input_path.name}: {e}")
-            
+                detail = f": {error}" if error else ""
+                progress.console.print(f"[red]✗[/red] {input_path.name}{detail}")
             progress.advance(task)
+        
+        if workers == 1:
+            for input_path, output_path in zip(valid_files, outputs):
+                report(input_path, output_path,
+                       *_convert_file(str(input_path), str(output_path), format.value, config))
+        else:
+            # Each conversion is a heavy pandoc/mmdc/Chromium run; spread them over processes
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_batch_worker,
+                initargs=(format.value, config),
+            ) as executor:
+                futures = {
+                    executor.submit(_convert_batch_file, str(input_path), str(output_path)):
+                        (input_path, output_path)
+                    for input_path, output_path in zip(valid_files, outputs)
+                }
+                for future in as_completed(futures):
+                    input_path, output_path = futures[future]
+                    try:
+                        success, error = future.result()
+                    except Exception as e:
+                        success, error = False, str(e)
+                    report(input_path, output_path, success, error)
     
     # Summary
     console.print()
@@ -29,6 +29,12 @@ from datetime import datetime
 from typing import Optional, Dict, List, Set, Any
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -148,7 +154,7 @@ class BuildCache:
         # Load builds
         if self.builds_file.exists():
             try:
-                data = json.loads(self.builds_file.read_text())
+                data = _json_loads(self.builds_file.read_bytes())
                 for key, record in data.items():
                     record['input_hash'] = FileHash(**record['input_hash'])
                     record['diagrams'] = [
@@ -162,7 +168,7 @@ class BuildCache:
         # Load diagrams
         if self.diagrams_file.exists():
             try:
-                data = json.loads(self.diagrams_file.read_text())
+                data = _json_loads(self.diagrams_file.read_bytes())
                 for key, diagram in data.items():
                     self.diagrams[key] = DiagramDependency(**diagram)
                 logger.debug(f"Loaded {len(self.diagrams)} diagram records")
@@ -10,6 +10,7 @@ Usage:
     success = markdown_to_pdf('input.md', 'output.pdf', profile='tech-whitepaper')
 """
 
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -288,18 +289,19 @@ def batch_convert(
         'html': markdown_to_html
     }
     
-    converter = format_map.get(output_format.lower())
+    output_format = output_format.lower()
+    converter = format_map.get(output_format)
     if not converter:
         raise ValueError(f"Unsupported output format: {output_format}")
+    suffix = f'.{output_format}'
     
     for input_file in input_files:
-        input_path = Path(input_file)
-        if not input_path.exists():
+        if not os.path.exists(input_file):
             print(f"[ERROR] File not found: {input_file}")
             results[input_file] = False
             continue
         
-        output_file = str(input_path.with_suffix(f'.{output_format.lower()}'))
+        output_file = os.path.splitext(input_file)[0] + suffix
         
         if verbose:
             print(f"\n{'='*70}")
@@ -39,6 +39,10 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# First H1 is normally near the top; search this prefix before the full document
+_H1_RE = re.compile(r'<h1[^>]*>([^<]+)</h1>', re.IGNORECASE)
+_H1_SEARCH_WINDOW = 65536
+
 
 @dataclass
 class MarkdownMetadata:
@@ -231,7 +235,9 @@ class MarkdownExporter:
         metadata = MarkdownMetadata()
         
         # Look for title (first H1)
-        h1_match = re.search(r'<h1[^>]*>([^<]+)</h1>', content, re.IGNORECASE)
+        h1_match = _H1_RE.search(content, 0, _H1_SEARCH_WINDOW)
+        if not h1_match and len(content) > _H1_SEARCH_WINDOW:
+            h1_match = _H1_RE.search(content)
         if h1_match:
             metadata.title = h1_match.group(1).strip()
         
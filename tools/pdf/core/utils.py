@@ -6,11 +6,12 @@ Utility functions for the PDF generation pipeline.
 These are shared across CLI and library usage.
 """
 
+import codecs
+import mmap
 import os
 import re
-import shutil
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Set
 
 
 def extract_metadata(content: str) -> Tuple[Dict[str, Any], str]:
@@ -23,8 +24,6 @@ def extract_metadata(content: str) -> Tuple[Dict[str, Any], str]:
     Returns:
         Tuple of (metadata dict, content without frontmatter)
     """
-    import yaml
-    
     metadata = {}
     body = content
     
@@ -34,15 +33,21 @@ def extract_metadata(content: str) -> Tuple[Dict[str, Any], str]:
         if end_match:
             yaml_content = content[3:end_match.start() + 3]
             body = content[end_match.end() + 3:]
-            
-            try:
-                metadata = yaml.safe_load(yaml_content) or {}
-            except yaml.YAMLError:
-                metadata = {}
+            metadata = _load_frontmatter(yaml_content)
     
     return metadata, body
 
 
+def _load_frontmatter(yaml_content: str) -> Dict[str, Any]:
+    """Parse frontmatter YAML, treating malformed YAML as empty."""
+    import yaml
+    
+    try:
+        return yaml.safe_load(yaml_content) or {}
+    except yaml.YAMLError:
+        return {}
+
+
 def get_cache_dir() -> Path:
     """
     Get the default cache directory for diagram caching.
@@ -64,6 +69,21 @@ def get_cache_dir() -> Path:
     return cache_dir
 
 
+def _find_tool(tool_class) -> Optional[str]:
+    """
+    Locate an external tool the same way the converters do.
+    
+    The wrappers scan each install directory once (cached) and fall back
+    to a cached PATH lookup, instead of probing candidate files one by one.
+    """
+    from external_tools import ToolNotFoundError
+    
+    try:
+        return tool_class().executable
+    except ToolNotFoundError:
+        return None
+
+
 def check_dependencies() -> bool:
     """
     Check if all required dependencies are available.
@@ -74,26 +94,17 @@ def check_dependencies() -> bool:
     errors = []
     warnings = []
     
-    # Check Pandoc
-    pandoc = shutil.which('pandoc')
-    if not pandoc:
-        # Check common Windows locations
-        windows_paths = [
-            r'C:\Program Files\Pandoc\pandoc.exe',
-            r'C:\Program Files (x86)\Pandoc\pandoc.exe',
-        ]
-        for path in windows_paths:
-            if Path(path).exists():
-                pandoc = path
-                break
+    from external_tools import PandocExecutor, MermaidCLI
     
+    # Check Pandoc
+    pandoc = _find_tool(PandocExecutor)
     if not pandoc:
         errors.append("Pandoc not found. Install from https://pandoc.org/installing.html")
     else:
         print(f"[OK] Pandoc found: {pandoc}")
     
     # Check Mermaid-CLI
-    mmdc = shutil.which('mmdc') or shutil.which('mmdc.cmd')
+    mmdc = _find_tool(MermaidCLI)
     if not mmdc:
         warnings.append("Mermaid-CLI not found. Diagrams will not render.")
         warnings.append("  Install: npm install -g @mermaid-js/mermaid-cli")
@@ -133,6 +144,37 @@ def check_dependencies() -> bool:
     return True
 
 
+# Any non-whitespace byte (used to spot empty Markdown files)
+_NON_SPACE_RE = re.compile(rb'\S')
+
+
+def _count_occurrences(buf: mmap.mmap, needle: bytes) -> int:
+    """Count non-overlapping occurrences of needle (mmap.count is 3.13+)."""
+    count = 0
+    pos = buf.find(needle)
+    while pos != -1:
+        count += 1
+        pos = buf.find(needle, pos + len(needle))
+    return count
+
+
+# Bytes decoded per step when checking the body is valid UTF-8
+_DECODE_CHUNK = 1 << 20
+
+
+def _utf8_error(buf: mmap.mmap) -> Optional[str]:
+    """Describe the first invalid UTF-8 sequence in buf, or None if it decodes."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    start = 0
+    try:
+        for start in range(0, len(buf), _DECODE_CHUNK):
+            decoder.decode(buf[start:start + _DECODE_CHUNK])
+        decoder.decode(b'', final=True)
+    except UnicodeDecodeError as e:
+        return f"File is not valid UTF-8 (byte {start + e.start}): {e.reason}"
+    return None
+
+
 def validate_markdown(md_file: str, verbose: bool = False) -> Tuple[bool, List[str]]:
     """
     Validate Markdown file and YAML frontmatter.
@@ -152,12 +194,39 @@ def validate_markdown(md_file: str, verbose: bool = False) -> Tuple[bool, List[s
         if not md_path.exists():
             return False, [f"File not found: {md_file}"]
         
-        md_content = md_path.read_text(encoding='utf-8')
+        # Only the frontmatter is decoded in full; the body is scanned as raw
+        # bytes through mmap and decoded in chunks just to check the encoding,
+        # so large documents are never held in memory at once.
+        frontmatter_lines = None
+        encoding_error = None
+        yaml_content = None
+        has_content = False
+        code_blocks = 0
+        
+        with md_path.open('rb') as f:
+            first_line = f.readline()
+            if first_line.startswith(b'---'):
+                frontmatter_lines = [first_line[3:]]
+                for line in f:
+                    if line.endswith(b'\n') and line.rstrip() == b'---':
+                        yaml_content = b''.join(frontmatter_lines).decode('utf-8')
+                        break
+                    frontmatter_lines.append(line)
+            
+            if first_line:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    has_content = _NON_SPACE_RE.search(mm) is not None
+                    code_blocks = _count_occurrences(mm, b'```')
+                    encoding_error = _utf8_error(mm)
+        
+        # ReadContentStep decodes the whole file as UTF-8 and would fail
+        if encoding_error:
+            errors.append(encoding_error)
         
-        # Validate YAML frontmatter
-        if md_content.startswith('---'):
+        # Validate YAML frontmatter (unterminated frontmatter yields no metadata)
+        if frontmatter_lines is not None:
             try:
-                metadata, _ = extract_metadata(md_content)
+                metadata = _load_frontmatter(yaml_content) if yaml_content is not None else {}
                 
                 if not metadata.get('title'):
                     warnings.append("No 'title' field in frontmatter")
@@ -173,11 +242,10 @@ def validate_markdown(md_file: str, verbose: bool = False) -> Tuple[bool, List[s
             warnings.append("No YAML frontmatter found (optional but recommended)")
         
         # Basic Markdown validation
-        if not md_content.strip():
+        if not has_content:
             errors.append("Markdown file is empty")
         
         # Check for mismatched code blocks
-        code_blocks = md_content.count('```')
         if code_blocks % 2 != 0:
             warnings.append("Possible mismatched code block delimiters")
         
@@ -187,6 +255,13 @@ def validate_markdown(md_file: str, verbose: bool = False) -> Tuple[bool, List[s
         return False, [f"Validation error: {e}"]
 
 
+# Default output location: output/ in the project root
+_DEFAULT_OUTPUT_ROOT = Path(__file__).parent.parent.parent.parent / "output"
+
+# Output directories already created by resolve_output_path() in this process
+_ENSURED_DIRS: Set[Path] = set()
+
+
 def resolve_output_path(output_file: str, output_dir: Optional[str] = None) -> str:
     """
     Resolve output path, applying output_dir if specified.
@@ -206,9 +281,10 @@ def resolve_output_path(output_file: str, output_dir: Optional[str] = None) -> s
         target = Path(output_dir) / output_path.name
     else:
         # Default to output/ in project root
-        project_root = Path(__file__).parent.parent.parent.parent
-        target = project_root / "output" / output_path.name
+        target = _DEFAULT_OUTPUT_ROOT / output_path.name
     
-    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.parent not in _ENSURED_DIRS:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(target.parent)
     return str(target)
 
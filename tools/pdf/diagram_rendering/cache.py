@@ -4,7 +4,9 @@ Diagram caching system for performance optimization.
 Includes cache metrics tracking for visibility into performance gains.
 """
 import hashlib
+import os
 import shutil
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -183,8 +185,11 @@ class DiagramCache:
         cache_hash = self._compute_hash(diagram_code, format, options)
         cached_file = self.cache_dir / f'{cache_hash}.{format.value}'
         
-        # Copy to cache
-        shutil.copy2(source_file, cached_file)
+        # Copy under a private name and rename into place, so concurrent
+        # renders (threads or worker processes) never read a partial file
+        tmp_file = cached_file.with_name(f'{cached_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        shutil.copy2(source_file, tmp_file)
+        os.replace(tmp_file, cached_file)
         
         return cached_file
     
@@ -10,10 +10,13 @@ Mermaid JS Version: 11.4.0+
 """
 import json
 import time
-import asyncio
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
 from pathlib import Path
-from playwright.async_api import Page, Browser
+
+# Playwright is only needed for type hints here; the caller supplies the page.
+# Deferring it keeps `import diagram_rendering` (e.g. for DiagramCache) cheap.
+if TYPE_CHECKING:
+    from playwright.async_api import Page
 
 try:
     from colorama import Fore, Style, init as colorama_init
@@ -76,7 +79,7 @@ class MermaidNativeRenderer:
         },
     }
     
-    def __init__(self, page: Page, verbose: bool = False):
+    def __init__(self, page: 'Page', verbose: bool = False):
         """
         Initialize native Mermaid renderer.
         
@@ -242,7 +245,7 @@ class MermaidNativeRenderer:
 
 # Convenience function for single renders
 async def render_mermaid_native(
-    page: Page,
+    page: 'Page',
     diagram_code: str,
     config: Optional[Dict] = None,
     theme_name: str = "dark",
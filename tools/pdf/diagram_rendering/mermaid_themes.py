@@ -187,9 +187,13 @@ class MermaidThemeGenerator:
     
     def generate_theme_json(self, profile: str) -> str:
         """Generate Mermaid theme as JSON."""
+        return json.dumps(self._theme_variables(profile), indent=2)
+    
+    def _theme_variables(self, profile: str) -> Dict[str, Any]:
+        """Build the Mermaid themeVariables dict for a profile."""
         config = self.get_theme(profile)
         if not config:
-            return json.dumps({})
+            return {}
         
         # Mermaid theme structure - CRITICAL: text colors must be set properly
         theme_config = {
@@ -223,12 +227,11 @@ class MermaidThemeGenerator:
             'fontFamilyCode': '"JetBrains Mono", monospace'
         }
         
-        return json.dumps(theme_config, indent=2)
+        return theme_config
     
     def generate_theme_config(self, profile: str) -> Dict[str, Any]:
         """Generate complete Mermaid config with theme."""
-        theme_json = self.generate_theme_json(profile)
-        theme_obj = json.loads(theme_json)
+        theme_obj = self._theme_variables(profile)
         
         config = {
             'startOnLoad': True,
@@ -278,6 +281,7 @@ class MermaidThemeGenerator:
         before Mermaid renders the diagrams.
         """
         config = self.generate_theme_config(profile)
+        config_json = json.dumps(config, indent=2)
         
         # Create Mermaid config script with proper theme injection
         config_script = f"""
@@ -286,9 +290,9 @@ class MermaidThemeGenerator:
             if (typeof mermaid === 'undefined') {{
                 window.mermaid = window.mermaid || {{}};  
             }}
-            window.mermaid = {json.dumps(config, indent=2)};
+            window.mermaid = {config_json};
             if (typeof mermaid !== 'undefined' && mermaid.initialize) {{
-                mermaid.initialize({json.dumps(config, indent=2)});
+                mermaid.initialize({config_json});
             }}
         </script>
         """
@@ -0,0 +1,46 @@
+"""
+Search-path tables for the external tool wrappers.
+
+Pandoc ships its own installers; Mermaid CLI, KaTeX and SVGO are npm
+global packages and share one set of locations.
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
+
+from ._platform import IS_WINDOWS, IS_DARWIN
+
+# category -> platform -> candidate directories ('~' is the user's home)
+_SEARCH_PATHS = {
+    'pandoc': {
+        'windows': (
+            'C:/Program Files/Pandoc',
+            'C:/Program Files (x86)/Pandoc',
+            '~/AppData/Local/Pandoc',
+            '~/.local/bin',
+        ),
+        'darwin': ('/usr/local/bin', '/opt/homebrew/bin', '~/.local/bin'),
+        'linux': ('/usr/bin', '/usr/local/bin', '~/.local/bin'),
+    },
+    'npm': {
+        'windows': ('~/AppData/Roaming/npm', 'C:/Program Files/nodejs'),
+        'darwin': ('/usr/local/bin', '/opt/homebrew/bin', '~/.npm-global/bin'),
+        'linux': ('/usr/local/bin', '/usr/bin', '~/.npm-global/bin', '~/.local/bin'),
+    },
+}
+
+_PLATFORM_KEY = 'windows' if IS_WINDOWS else 'darwin' if IS_DARWIN else 'linux'
+
+
+@lru_cache(maxsize=None)
+def search_paths(category: str) -> Tuple[Path, ...]:
+    """
+    Get the installation directories to search for a tool category.
+    
+    Args:
+        category: 'pandoc' or 'npm'
+        
+    Returns:
+        Candidate directories for the current platform, in priority order
+    """
+    return tuple(Path(p).expanduser() for p in _SEARCH_PATHS[category][_PLATFORM_KEY])
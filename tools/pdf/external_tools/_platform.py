@@ -0,0 +1,17 @@
+"""
+Host platform flags, computed once at import.
+
+Derived from sys.platform, a constant set at interpreter build time, rather
+than platform.system(), which can shell out (uname) on some platforms.
+The tool wrappers branch on these flags instead of re-probing per call.
+"""
+import sys
+
+SYSTEM = sys.platform
+
+IS_WINDOWS = SYSTEM == 'win32'
+IS_DARWIN = SYSTEM == 'darwin'
+IS_LINUX = SYSTEM.startswith('linux')
+
+# Executable suffixes to try, in order (bare name last)
+EXE_SUFFIXES = ('.exe', '.cmd', '.bat', '') if IS_WINDOWS else ('',)
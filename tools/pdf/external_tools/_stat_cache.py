@@ -0,0 +1,32 @@
+"""
+Cached existence checks for files passed to the tool wrappers.
+
+Theme configs, reference documents and the Puppeteer config are checked on
+every render, but they don't disappear during a build. Only hits are
+remembered: a file created after its first check (e.g. in a long-running
+service) is picked up on the next call.
+"""
+from typing import Set
+import os
+
+
+# Paths seen to exist, cleared wholesale when full
+_EXISTING: Set[str] = set()
+_EXISTING_MAX = 1024
+
+
+def exists(path: str) -> bool:
+    """os.path.exists(), remembered per path once it is True."""
+    if path in _EXISTING:
+        return True
+    if not os.path.exists(path):
+        return False
+    if len(_EXISTING) >= _EXISTING_MAX:
+        _EXISTING.clear()
+    _EXISTING.add(path)
+    return True
+
+
+def invalidate() -> None:
+    """Forget all cached results (for tests that delete files mid-run)."""
+    _EXISTING.clear()
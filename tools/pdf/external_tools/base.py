@@ -7,6 +7,8 @@ from typing import List, Optional, Dict, Any
 from pathlib import Path
 import subprocess
 
+from .executable_finder import find_in_directory, cached_which
+
 
 class ToolNotFoundError(Exception):
     """Raised when an external tool executable cannot be found."""
@@ -36,8 +38,14 @@ class ExternalTool(ABC):
     - Consistent command execution interface
     - Error handling
     - Testability (can be mocked)
+    
+    The resolved executable is remembered per wrapper class, so tools
+    constructed again (e.g. once per document) skip the search.
     """
     
+    # Wrapper class -> resolved executable path (hits only)
+    _resolved_executables: Dict[type, str] = {}
+    
     def __init__(self, executable_path: Optional[str] = None):
         """
         Initialize tool wrapper.
@@ -46,7 +54,8 @@ class ExternalTool(ABC):
             executable_path: Optional explicit path to executable.
                            If None, will search common locations.
         """
-        self._executable = executable_path or self._find_executable()
+        self._available: Optional[bool] = None
+        self._executable = executable_path or self._resolve_executable()
         if not self._executable:
             raise ToolNotFoundError(
                 f"{self.__class__.__name__}: Executable not found. "
@@ -79,6 +88,16 @@ class ExternalTool(ABC):
         """
         pass
     
+    def _resolve_executable(self) -> Optional[str]:
+        """Find the executable, reusing an earlier result for this class."""
+        cls = type(self)
+        executable = ExternalTool._resolved_executables.get(cls)
+        if executable is None:
+            executable = self._find_executable()
+            if executable:
+                ExternalTool._resolved_executables[cls] = executable
+        return executable
+    
     def _find_executable(self) -> Optional[str]:
         """
         Find executable in search paths or system PATH.
@@ -86,18 +105,16 @@ class ExternalTool(ABC):
         Returns:
             Path to executable if found, None otherwise.
         """
-        import shutil
-        
         # First check explicit search paths
+        exe_names = self._get_executable_names()
         for search_path in self._get_search_paths():
-            for exe_name in self._get_executable_names():
-                candidate = search_path / exe_name
-                if candidate.exists() and candidate.is_file():
-                    return str(candidate)
+            candidate = find_in_directory(search_path, exe_names)
+            if candidate:
+                return str(candidate)
         
         # Fallback to system PATH
-        for exe_name in self._get_executable_names():
-            found = shutil.which(exe_name)
+        for exe_name in exe_names:
+            found = cached_which(exe_name)
             if found:
                 return found
         
@@ -111,7 +128,8 @@ class ExternalTool(ABC):
         check: bool = True,
         shell: bool = False,
         cwd: Optional[Path] = None,
-        env: Optional[Dict[str, str]] = None
+        env: Optional[Dict[str, str]] = None,
+        encoding: Optional[str] = None
     ) -> CommandResult:
         """
         Execute the tool with given arguments.
@@ -121,9 +139,12 @@ class ExternalTool(ABC):
             input_text: Optional stdin input
             timeout: Optional timeout in seconds
             check: If True, raise exception on non-zero exit code
-            shell: If True, run command through shell
+            shell: If True, run command through shell. Not needed for
+                   npm .cmd shims on Windows: the resolved executable is a
+                   full path, which subprocess can launch directly.
             cwd: Optional working directory
             env: Optional environment variables
+            encoding: Optional stdin/stdout encoding (default: locale encoding)
             
         Returns:
             CommandResult with execution details
@@ -144,7 +165,8 @@ class ExternalTool(ABC):
                 check=check,
                 shell=shell,
                 cwd=cwd,
-                env=env
+                env=env,
+                encoding=encoding
             )
             
             return CommandResult(
@@ -166,9 +188,18 @@ class ExternalTool(ABC):
         """
         Check if tool is available and working.
         
+        The result is cached on the instance, so repeated checks
+        (including after a miss) don't spawn the tool again.
+        
         Returns:
             True if tool can be executed, False otherwise.
         """
+        if self._available is None:
+            self._available = self._check_available()
+        return self._available
+    
+    def _check_available(self) -> bool:
+        """Probe the tool with common version/help flags."""
         try:
             # Try running with --version or --help
             version_flags = ['--version', '-v', '--help', '-h']
@@ -1,10 +1,151 @@
 """
 Platform-independent executable finder utility.
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-import platform
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 import os
+import shutil
+
+from ._platform import IS_WINDOWS, IS_DARWIN, IS_LINUX, EXE_SUFFIXES
+
+
+# Executable names depend only on the host, so each is computed once per name.
+@lru_cache(maxsize=None)
+def _platform_executables(base_name: str) -> Tuple[str, ...]:
+    return tuple(f'{base_name}{suffix}' for suffix in EXE_SUFFIXES)
+
+
+# Install locations that don't depend on the tool name, built once at import
+_HOME = Path.home()
+if IS_WINDOWS:
+    _FIXED_INSTALL_PATHS: Tuple[Path, ...] = ()
+elif IS_DARWIN:  # macOS
+    _FIXED_INSTALL_PATHS = (
+        Path('/usr/local/bin'),
+        Path('/opt/homebrew/bin'),
+    )
+elif IS_LINUX:
+    _FIXED_INSTALL_PATHS = (
+        Path('/usr/bin'),
+        Path('/usr/local/bin'),
+        Path('/opt/bin'),
+        _HOME / '.local' / 'bin',
+    )
+else:
+    _FIXED_INSTALL_PATHS = ()
+# Common to all platforms
+_SHARED_INSTALL_PATHS = (_HOME / 'bin', _HOME / '.bin')
+
+
+# Install directories seen to exist. Misses aren't kept, so a directory
+# created while the process runs (first npm i -g, new Homebrew) is seen.
+_EXISTING_DIRS: Set[Path] = set()
+
+
+def _dir_exists(path: Path) -> bool:
+    """os.path.isdir(), remembered per path once it is True."""
+    if path in _EXISTING_DIRS:
+        return True
+    if not os.path.isdir(path):
+        return False
+    _EXISTING_DIRS.add(path)
+    return True
+
+
+@lru_cache(maxsize=None)
+def _candidate_install_paths(tool_name: str) -> Tuple[Path, ...]:
+    if IS_WINDOWS:
+        paths = [
+            Path(f'C:/Program Files/{tool_name}'),
+            Path(f'C:/Program Files (x86)/{tool_name}'),
+            _HOME / 'AppData' / 'Local' / tool_name,
+            _HOME / 'AppData' / 'Roaming' / tool_name,
+        ]
+        
+        # Node.js global npm packages (for mermaid-cli, katex, etc.)
+        if tool_name.lower() in ['npm', 'node']:
+            paths.append(_HOME / 'AppData' / 'Roaming' / 'npm')
+    elif IS_DARWIN:
+        paths = [
+            *_FIXED_INSTALL_PATHS,
+            Path(f'/Applications/{tool_name}.app/Contents/MacOS'),
+            _HOME / 'Applications' / f'{tool_name}.app' / 'Contents' / 'MacOS',
+            _HOME / '.local' / 'bin',
+        ]
+    else:
+        paths = list(_FIXED_INSTALL_PATHS)
+    
+    paths.extend(_SHARED_INSTALL_PATHS)
+    return tuple(paths)
+
+
+def _common_install_paths(tool_name: str) -> Tuple[Path, ...]:
+    return tuple(p for p in _candidate_install_paths(tool_name) if _dir_exists(p))
+
+
+# Directory listings keyed by path, revalidated against the directory mtime
+_DIR_LISTINGS: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+_DIR_LISTINGS_MAX = 64
+
+
+def _directory_names(directory: Path) -> FrozenSet[str]:
+    """
+    Names of the entries in a directory (empty if it doesn't exist).
+    
+    One scandir replaces a stat per candidate executable name, most of
+    which would fail with ENOENT.
+    """
+    key = str(directory)
+    try:
+        mtime = os.stat(key).st_mtime
+    except OSError:
+        return frozenset()
+    
+    cached = _DIR_LISTINGS.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        with os.scandir(key) as entries:
+            if IS_WINDOWS:  # case-insensitive filesystem
+                names = frozenset(entry.name.lower() for entry in entries)
+            else:
+                names = frozenset(entry.name for entry in entries)
+    except OSError:
+        return frozenset()
+    
+    if len(_DIR_LISTINGS) >= _DIR_LISTINGS_MAX:
+        _DIR_LISTINGS.pop(next(iter(_DIR_LISTINGS)))
+    _DIR_LISTINGS[key] = (mtime, names)
+    return names
+
+
+def find_in_directory(directory: Path, exe_names: List[str]) -> Optional[Path]:
+    """Return the first of exe_names that is a file in directory, if any."""
+    names = _directory_names(directory)
+    for exe_name in exe_names:
+        if (exe_name.lower() if IS_WINDOWS else exe_name) in names:
+            candidate = directory / exe_name
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+# shutil.which hits keyed by (name, PATH). Misses aren't kept, so a tool
+# installed while the process runs (e.g. npm i -g) is found on the next call.
+_WHICH_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def cached_which(exe_name: str) -> Optional[str]:
+    """shutil.which() with a process-wide cache; re-resolves if PATH changes."""
+    key = (exe_name, os.environ.get('PATH', ''))
+    found = _WHICH_CACHE.get(key)
+    if found is None:
+        found = shutil.which(exe_name)
+        if found is not None:
+            _WHICH_CACHE[key] = found
+    return found
 
 
 class ExecutableFinder:
@@ -30,17 +171,7 @@ class ExecutableFinder:
             List of possible executable names for current platform.
             Example on Windows: ['pandoc.exe', 'pandoc.cmd', 'pandoc']
         """
-        system = platform.system().lower()
-        
-        if system == 'windows':
-            return [
-                f'{base_name}.exe',
-                f'{base_name}.cmd',
-                f'{base_name}.bat',
-                base_name
-            ]
-        else:
-            return [base_name]
+        return list(_platform_executables(base_name))
     
     @staticmethod
     def get_common_install_paths(tool_name: str) -> List[Path]:
@@ -53,55 +184,14 @@ class ExecutableFinder:
         Returns:
             List of common installation directories for current platform.
         """
-        system = platform.system().lower()
-        paths = []
-        
-        if system == 'windows':
-            # Windows common locations
-            paths.extend([
-                Path(f'C:/Program Files/{tool_name}'),
-                Path(f'C:/Program Files (x86)/{tool_name}'),
-                Path.home() / 'AppData' / 'Local' / tool_name,
-                Path.home() / 'AppData' / 'Roaming' / tool_name,
-            ])
-            
-            # Node.js global npm packages (for mermaid-cli, katex, etc.)
-            if tool_name.lower() in ['npm', 'node']:
-                npm_path = Path.home() / 'AppData' / 'Roaming' / 'npm'
-                paths.append(npm_path)
-        
-        elif system == 'darwin':  # macOS
-            # macOS common locations
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/opt/homebrew/bin'),
-                Path(f'/Applications/{tool_name}.app/Contents/MacOS'),
-                Path.home() / 'Applications' / f'{tool_name}.app' / 'Contents' / 'MacOS',
-                Path.home() / '.local' / 'bin',
-            ])
-        
-        elif system == 'linux':
-            # Linux common locations
-            paths.extend([
-                Path('/usr/bin'),
-                Path('/usr/local/bin'),
-                Path('/opt/bin'),
-                Path.home() / '.local' / 'bin',
-            ])
-        
-        # Common to all platforms
-        paths.extend([
-            Path.home() / 'bin',
-            Path.home() / '.bin',
-        ])
-        
-        return [p for p in paths if p.exists()]
+        return list(_common_install_paths(tool_name))
     
     @staticmethod
     def find_executable(
         base_name: str,
         search_paths: Optional[List[Path]] = None,
-        use_path: bool = True
+        use_path: bool = True,
+        resolve: bool = False
     ) -> Optional[str]:
         """
         Find executable in search paths or system PATH.
@@ -110,29 +200,27 @@ class ExecutableFinder:
             base_name: Base executable name (e.g., 'pandoc')
             search_paths: Optional list of directories to search
             use_path: If True, also search system PATH
+            resolve: If True, canonicalize symlinks in a search-path hit
+                     (costs a readlink per path component)
             
         Returns:
             Full path to executable if found, None otherwise.
         """
-        import shutil
-        
         exe_names = ExecutableFinder.get_platform_executables(base_name)
         
         # Search explicit paths first
         if search_paths:
             for search_dir in search_paths:
-                if not search_dir.exists():
-                    continue
-                    
-                for exe_name in exe_names:
-                    candidate = search_dir / exe_name
-                    if candidate.exists() and candidate.is_file():
+                candidate = find_in_directory(search_dir, exe_names)
+                if candidate:
+                    if resolve:
                         return str(candidate.resolve())
+                    return os.path.abspath(candidate)
         
         # Fallback to system PATH
         if use_path:
             for exe_name in exe_names:
-                found = shutil.which(exe_name)
+                found = cached_which(exe_name)
                 if found:
                     return found
         
@@ -149,6 +237,11 @@ class ExecutableFinder:
         Returns:
             Expanded Path object
         """
-        expanded = os.path.expandvars(os.path.expanduser(path))
-        return Path(expanded)
+        # Each expansion rescans the string (and expanduser may hit the
+        # password database), so only run the ones that can change it.
+        if path.startswith('~'):
+            path = os.path.expanduser(path)
+        if '$' in path or (IS_WINDOWS and '%' in path):
+            path = os.path.expandvars(path)
+        return Path(path)
 
@@ -1,11 +1,131 @@
 """
 KaTeX CLI wrapper for math rendering.
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-import platform
+from typing import Dict, List, Optional, Tuple
+import atexit
+import json
+import queue
+import subprocess
+import threading
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+from ._paths import search_paths
+from ._platform import IS_WINDOWS
 from .base import ExternalTool, CommandResult
+from .executable_finder import cached_which
+
+
+# Node loop used by the warm server (shipped next to this module)
+SERVER_SCRIPT = Path(__file__).parent / 'katex_server.js'
+
+
+class _KatexServer:
+    """
+    Long-lived Node process that renders expressions with katex.renderToString.
+    
+    Replaces one process launch per expression with a stdin write and a
+    stdout readline. Thread-safe; one request is in flight at a time.
+    """
+    
+    def __init__(self, node: str, katex_dir: Path):
+        self._process = subprocess.Popen(
+            [node, str(SERVER_SCRIPT), str(katex_dir)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding='utf-8',
+        )
+        self._lock = threading.Lock()
+        self._lines: 'queue.Queue[str]' = queue.Queue()
+        reader = threading.Thread(target=self._read_stdout, daemon=True)
+        reader.start()
+    
+    def _read_stdout(self) -> None:
+        for line in self._process.stdout:
+            self._lines.put(line)
+        self._lines.put('')  # EOF: server exited
+    
+    @property
+    def alive(self) -> bool:
+        return self._process.poll() is None
+    
+    def render(self, latex_code: str, display: bool, timeout: float) -> Optional[str]:
+        """
+        Render one expression.
+        
+        Returns:
+            Rendered HTML, or None on a KaTeX error
+            
+        Raises:
+            RuntimeError: If the server died or did not answer in time
+        """
+        return self.render_many([(latex_code, display)], timeout)[0]
+    
+    def render_many(self, expressions: List[Tuple[str, bool]], timeout: float) -> List[Optional[str]]:
+        """
+        Render (latex_code, display) pairs in one pipelined exchange.
+        
+        All requests are written before any response is read; the reader
+        thread drains stdout meanwhile, so neither pipe can fill up.
+        
+        Raises:
+            RuntimeError: If the server died or did not answer in time
+        """
+        requests = ''.join(
+            json.dumps({'expr': code, 'display': display}) + '\n'
+            for code, display in expressions
+        )
+        with self._lock:
+            try:
+                self._process.stdin.write(requests)
+                self._process.stdin.flush()
+                lines = [self._lines.get(timeout=timeout) for _ in expressions]
+            except (OSError, ValueError, queue.Empty) as e:
+                self.close()
+                raise RuntimeError(f"KaTeX server not responding: {e}")
+        
+        if not all(lines):
+            raise RuntimeError("KaTeX server exited")
+        return [_json_loads(line).get('html') for line in lines]
+    
+    def close(self) -> None:
+        if self.alive:
+            self._process.kill()
+            self._process.wait()
+
+
+@lru_cache(maxsize=None)
+def _find_katex_package(executable_path: str) -> Optional[Path]:
+    """Locate the katex npm package behind the CLI executable."""
+    executable = Path(executable_path)
+    candidates = [
+        executable.resolve().parent,                    # symlink → katex/cli.js
+        executable.parent / 'node_modules' / 'katex',  # Windows npm shim
+        executable.parent.parent / 'lib' / 'node_modules' / 'katex',
+    ]
+    for candidate in candidates:
+        if (candidate / 'package.json').exists() and (candidate / 'cli.js').exists():
+            return candidate
+    return None
+
+
+# Warm servers shared across KatexCLI instances, keyed by KaTeX package dir
+_SERVERS: Dict[str, _KatexServer] = {}
+_SERVERS_LOCK = threading.Lock()
+
+
+@atexit.register
+def _close_servers() -> None:
+    for server in _SERVERS.values():
+        server.close()
+    _SERVERS.clear()
 
 
 class KatexCLI(ExternalTool):
@@ -13,39 +133,67 @@ class KatexCLI(ExternalTool):
     KaTeX CLI wrapper for server-side math rendering.
     
     Converts LaTeX math expressions to HTML for embedding in documents.
+    When Node and the katex package can be located, expressions are sent to
+    a single warm Node process shared for the life of the Python process;
+    otherwise each expression is a separate CLI call.
     """
     
+    SEARCH_CATEGORY = 'npm'
+    
     def _get_executable_names(self) -> List[str]:
         """Get platform-specific katex executable names."""
-        if platform.system().lower() == 'windows':
+        if IS_WINDOWS:
             return ['katex.cmd', 'katex.exe', 'katex']
         return ['katex']
     
     def _get_search_paths(self) -> List[Path]:
         """Get common KaTeX installation paths (npm global)."""
-        system = platform.system().lower()
-        paths = []
+        return list(search_paths(self.SEARCH_CATEGORY))
+    
+    def _get_server(self) -> Optional[_KatexServer]:
+        """Get (or start) the shared warm server, or None if unavailable."""
+        katex_dir = _find_katex_package(self.executable)
+        node = cached_which('node')
+        if katex_dir is None or node is None or not SERVER_SCRIPT.exists():
+            return None
         
-        if system == 'windows':
-            paths.extend([
-                Path.home() / 'AppData' / 'Roaming' / 'npm',
-                Path('C:/Program Files/nodejs'),
-            ])
-        elif system == 'darwin':
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/opt/homebrew/bin'),
-                Path.home() / '.npm-global' / 'bin',
-            ])
-        else:  # Linux
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/usr/bin'),
-                Path.home() / '.npm-global' / 'bin',
-                Path.home() / '.local' / 'bin',
-            ])
+        key = str(katex_dir)
+        with _SERVERS_LOCK:
+            server = _SERVERS.get(key)
+            if server is None or not server.alive:
+                try:
+                    server = _KatexServer(node, katex_dir)
+                except OSError:
+                    return None
+                _SERVERS[key] = server
+            return server
+    
+    def _render(self, latex_code: str, display: bool, timeout: int) -> Optional[str]:
+        """Render via the warm server, falling back to one CLI call."""
+        server = self._get_server()
+        if server is not None:
+            try:
+                return server.render(latex_code, display, timeout)
+            except RuntimeError:
+                pass  # Server died; fall through to the CLI
         
-        return paths
+        return self._render_cli(latex_code, display, timeout)
+    
+    def _render_cli(self, latex_code: str, display: bool, timeout: int) -> Optional[str]:
+        """Render one expression with a separate katex CLI process."""
+        try:
+            result = self.execute(
+                ['--display-mode'] if display else [],
+                input_text=latex_code,
+                timeout=timeout,
+                check=False
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None  # Leave this expression unrendered, not the batch
+        
+        if result.success:
+            return result.stdout.strip()
+        return None
     
     def render_inline(self, latex_code: str, timeout: int = 5) -> Optional[str]:
         """
@@ -58,16 +206,7 @@ class KatexCLI(ExternalTool):
         Returns:
             Rendered HTML string, or None if rendering failed
         """
-        result = self.execute(
-            [],
-            input_text=latex_code,
-            timeout=timeout,
-            check=False
-        )
-        
-        if result.success:
-            return result.stdout.strip()
-        return None
+        return self._render(latex_code, display=False, timeout=timeout)
     
     def render_display(self, latex_code: str, timeout: int = 5) -> Optional[str]:
         """
@@ -80,14 +219,34 @@ class KatexCLI(ExternalTool):
         Returns:
             Rendered HTML string, or None if rendering failed
         """
-        result = self.execute(
-            ['--display-mode'],
-            input_text=latex_code,
-            timeout=timeout,
-            check=False
-        )
+        return self._render(latex_code, display=True, timeout=timeout)
+    
+    def render_batch(
+        self,
+        expressions: List[Tuple[str, bool]],
+        timeout: int = 5
+    ) -> List[Optional[str]]:
+        """
+        Render many expressions at once.
         
-        if result.success:
-            return result.stdout.strip()
-        return None
-
+        With the warm server this is a single pipelined exchange; without
+        it each expression falls back to its own CLI call.
+        
+        Args:
+            expressions: (latex_code, display_mode) pairs
+            timeout: Per-expression timeout in seconds
+            
+        Returns:
+            Rendered HTML (or None on failure) for each expression, in order
+        """
+        if not expressions:
+            return []
+        
+        server = self._get_server()
+        if server is not None:
+            try:
+                return server.render_many(expressions, timeout)
+            except RuntimeError:
+                pass  # Server died; fall through to the CLI
+        
+        return [self._render_cli(code, display, timeout) for code, display in expressions]
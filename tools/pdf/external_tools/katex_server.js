@@ -0,0 +1,18 @@
+// Warm KaTeX renderer used by KatexCLI (external_tools/katex.py).
+//
+// Usage: node katex_server.js <path-to-katex-package>
+// Protocol: one JSON request per line on stdin, {"expr": ..., "display": bool};
+// one JSON response per line on stdout, {"html": ...} or {"error": ...}.
+const katex = require(process.argv[2]);
+const rl = require('readline').createInterface({input: process.stdin});
+
+rl.on('line', (line) => {
+  let out;
+  try {
+    const req = JSON.parse(line);
+    out = {html: katex.renderToString(req.expr, {displayMode: req.display})};
+  } catch (e) {
+    out = {error: String((e && e.message) || e)};
+  }
+  process.stdout.write(JSON.stringify(out) + '\n');
+});
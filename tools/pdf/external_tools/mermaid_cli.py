@@ -1,16 +1,40 @@
 """
 Mermaid CLI wrapper for diagram rendering.
 """
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
-import platform
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import os
+import re
+import subprocess
 
+from . import _stat_cache
+from ._paths import search_paths
+from ._platform import IS_WINDOWS
 from .base import ExternalTool, CommandResult
 
 
 # Puppeteer config for Docker/Linux (--no-sandbox required when running as root)
 PUPPETEER_CONFIG = Path(__file__).parent.parent / "config" / "puppeteer-config.json"
 
+# Each mmdc process runs its own headless Chrome; more than a few at once
+# thrashes memory rather than finishing sooner.
+DEFAULT_MAX_CONCURRENT_RENDERS = 4
+
+# Diagram type keywords, matched in a single pass as whole words
+_MERMAID_KEYWORD_RE = re.compile(
+    r'\b(?:graph|flowchart|sequenceDiagram|classDiagram|stateDiagram|erDiagram'
+    r'|journey|gantt|pie|gitGraph|mindmap|timeline|C4Context|C4Container)\b'
+)
+
+# Markdown image reference after optional leading whitespace
+_IMAGE_REF_RE = re.compile(r'\s*!\[')
+
+# validate_diagram() results keyed by source digest (FIFO-evicted)
+_VALIDATE_CACHE: Dict[bytes, bool] = {}
+_VALIDATE_CACHE_MAX = 4096
+
 
 class MermaidCLI(ExternalTool):
     """
@@ -20,38 +44,17 @@ class MermaidCLI(ExternalTool):
     with theme customization and quality settings.
     """
     
+    SEARCH_CATEGORY = 'npm'
+    
     def _get_executable_names(self) -> List[str]:
         """Get platform-specific mmdc executable names."""
-        if platform.system().lower() == 'windows':
+        if IS_WINDOWS:
             return ['mmdc.cmd', 'mmdc.exe', 'mmdc']
         return ['mmdc']
     
     def _get_search_paths(self) -> List[Path]:
         """Get common Mermaid CLI installation paths (npm global)."""
-        system = platform.system().lower()
-        paths = []
-        
-        if system == 'windows':
-            # Windows npm global packages
-            paths.extend([
-                Path.home() / 'AppData' / 'Roaming' / 'npm',
-                Path('C:/Program Files/nodejs'),
-            ])
-        elif system == 'darwin':  # macOS
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/opt/homebrew/bin'),
-                Path.home() / '.npm-global' / 'bin',
-            ])
-        else:  # Linux
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/usr/bin'),
-                Path.home() / '.npm-global' / 'bin',
-                Path.home() / '.local' / 'bin',
-            ])
-        
-        return paths
+        return list(search_paths(self.SEARCH_CATEGORY))
     
     def render_to_svg(
         self,
@@ -60,7 +63,8 @@ class MermaidCLI(ExternalTool):
         theme: str = 'neutral',
         background: str = 'transparent',
         theme_config: Optional[Path] = None,
-        scale: float = 1.0
+        scale: float = 1.0,
+        timeout: Optional[int] = None
     ) -> CommandResult:
         """
         Render Mermaid diagram to SVG.
@@ -72,9 +76,13 @@ class MermaidCLI(ExternalTool):
             background: Background color ('transparent', 'white', etc.)
             theme_config: Optional path to theme config JSON file
             scale: Scale factor for output
+            timeout: Optional timeout in seconds
             
         Returns:
             CommandResult with execution details
+            
+        Raises:
+            subprocess.TimeoutExpired: If timeout exceeded
         """
         args = [
             '-i', str(input_file),
@@ -83,17 +91,17 @@ class MermaidCLI(ExternalTool):
             '-b', background
         ]
         
-        if theme_config and theme_config.exists():
+        if theme_config and _stat_cache.exists(str(theme_config)):
             args.extend(['-c', str(theme_config)])
         
         if scale != 1.0:
             args.extend(['-s', str(scale)])
         
         # Add puppeteer config for Linux/Docker (--no-sandbox required as root)
-        if platform.system().lower() != 'windows' and PUPPETEER_CONFIG.exists():
+        if not IS_WINDOWS and _stat_cache.exists(str(PUPPETEER_CONFIG)):
             args.extend(['-p', str(PUPPETEER_CONFIG)])
         
-        return self.execute(args, check=False, shell=(platform.system().lower() == 'windows'))
+        return self.execute(args, timeout=timeout, check=False)
     
     def render_to_png(
         self,
@@ -102,7 +110,8 @@ class MermaidCLI(ExternalTool):
         theme: str = 'neutral',
         background: str = 'white',
         theme_config: Optional[Path] = None,
-        scale: float = 2.0
+        scale: float = 2.0,
+        timeout: Optional[int] = None
     ) -> CommandResult:
         """
         Render Mermaid diagram to PNG (high resolution).
@@ -114,9 +123,13 @@ class MermaidCLI(ExternalTool):
             background: Background color (recommended: 'white' for PNG)
             theme_config: Optional theme config JSON
             scale: Scale factor (2.0 = high res, good for printing)
+            timeout: Optional timeout in seconds
             
         Returns:
             CommandResult with execution details
+            
+        Raises:
+            subprocess.TimeoutExpired: If timeout exceeded
         """
         args = [
             '-i', str(input_file),
@@ -126,14 +139,60 @@ class MermaidCLI(ExternalTool):
             '-s', str(scale)
         ]
         
-        if theme_config and theme_config.exists():
+        if theme_config and _stat_cache.exists(str(theme_config)):
             args.extend(['-c', str(theme_config)])
         
         # Add puppeteer config for Linux/Docker (--no-sandbox required as root)
-        if platform.system().lower() != 'windows' and PUPPETEER_CONFIG.exists():
+        if not IS_WINDOWS and _stat_cache.exists(str(PUPPETEER_CONFIG)):
             args.extend(['-p', str(PUPPETEER_CONFIG)])
         
-        return self.execute(args, check=False, shell=(platform.system().lower() == 'windows'))
+        return self.execute(args, timeout=timeout, check=False)
+    
+    def render_many(
+        self,
+        jobs: List[Tuple[Path, Path, Dict[str, Any]]],
+        max_workers: int = DEFAULT_MAX_CONCURRENT_RENDERS
+    ) -> List[CommandResult]:
+        """
+        Render several diagrams concurrently, one mmdc process each.
+        
+        Each job is (input_file, output_file, options); the output suffix
+        picks render_to_png() for '.png' and render_to_svg() otherwise, and
+        options are passed through as keyword arguments (including
+        timeout; a job that times out is reported as failed). Threads suffice
+        since Python only waits on the child processes; max_workers caps
+        how many headless browsers run at once.
+        
+        Args:
+            jobs: (input_file, output_file, options) per diagram
+            max_workers: Maximum concurrent mmdc processes
+            
+        Returns:
+            CommandResult for each job, in order
+        """
+        if not jobs:
+            return []
+        
+        def run(job: Tuple[Path, Path, Dict[str, Any]]) -> CommandResult:
+            input_file, output_file, options = job
+            render = self.render_to_png if output_file.suffix.lower() == '.png' else self.render_to_svg
+            try:
+                return render(input_file, output_file, **options)
+            except subprocess.TimeoutExpired as e:
+                # A hung mmdc fails only its own diagram
+                return CommandResult(
+                    returncode=-1,
+                    stdout='',
+                    stderr=f"mmdc timed out after {e.timeout}s",
+                    success=False
+                )
+        
+        workers = max(1, min(len(jobs), max_workers, os.cpu_count() or 1))
+        if workers == 1:
+            return [run(job) for job in jobs]
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(run, jobs))
     
     def validate_diagram(self, mermaid_code: str) -> bool:
         """
@@ -145,16 +204,21 @@ class MermaidCLI(ExternalTool):
         Returns:
             True if code contains valid Mermaid keywords, False otherwise
         """
-        mermaid_keywords = [
-            'graph', 'flowchart', 'sequenceDiagram', 'classDiagram',
-            'stateDiagram', 'erDiagram', 'journey', 'gantt', 'pie',
-            'gitGraph', 'mindmap', 'timeline', 'C4Context', 'C4Container'
-        ]
+        # The same block is often validated again (can_render, then render)
+        key = hashlib.blake2b(mermaid_code.encode('utf-8'), digest_size=16).digest()
+        cached = _VALIDATE_CACHE.get(key)
+        if cached is not None:
+            return cached
         
-        # Check if code starts with image reference (invalid)
-        if mermaid_code.strip().startswith('!['):
-            return False
+        # Code starting with an image reference is invalid; otherwise
+        # check if any valid keyword is present
+        valid = (
+            not _IMAGE_REF_RE.match(mermaid_code)
+            and _MERMAID_KEYWORD_RE.search(mermaid_code) is not None
+        )
         
-        # Check if any valid keyword is present
-        return any(keyword in mermaid_code for keyword in mermaid_keywords)
+        if len(_VALIDATE_CACHE) >= _VALIDATE_CACHE_MAX:
+            del _VALIDATE_CACHE[next(iter(_VALIDATE_CACHE))]
+        _VALIDATE_CACHE[key] = valid
+        return valid
 
@@ -1,13 +1,54 @@
 """
 Pandoc executor wrapper with platform-independent resolution.
 """
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-import platform
+from typing import List, Optional, Tuple
+import os
 
+from . import _stat_cache
+from ._paths import search_paths
+from ._platform import IS_WINDOWS
 from .base import ExternalTool
 
 
+# Recommended markdown extensions (see get_default_markdown_extensions)
+DEFAULT_MARKDOWN_EXTENSIONS = (
+    'pipe_tables',
+    'backtick_code_blocks',
+    'fenced_code_attributes',
+    'smart',
+    'tex_math_dollars',  # $...$ and $$...$$
+    'tex_math_double_backslash',  # \[...\] and \(...\)
+    'raw_html',
+    'fenced_code_blocks',
+    'autolink_bare_uris',
+    'strikeout',  # ~~text~~
+    'superscript',  # ^text^
+    'subscript',  # ~text~
+)
+
+# Fixed target-format arguments
+_HTML_TARGET_ARGS = ('-t', 'html5', '--mathjax')
+_DOCX_TARGET_ARGS = ('-t', 'docx')
+
+# TOC flags for the usual depths, so calls don't rebuild them
+_TOC_FLAGS = {depth: ('--toc', f'--toc-depth={depth}') for depth in range(1, 7)}
+
+
+@lru_cache(maxsize=32)
+def _format_string(markdown_format: str, extensions: Tuple[str, ...]) -> str:
+    """Build a Pandoc input format such as 'markdown+smart+raw_html'."""
+    if extensions:
+        return f"{markdown_format}+{'+'.join(extensions)}"
+    return markdown_format
+
+
+def _toc_flags(toc_depth: int) -> Tuple[str, ...]:
+    """Get the --toc/--toc-depth flag pair for a depth."""
+    return _TOC_FLAGS.get(toc_depth) or ('--toc', f'--toc-depth={toc_depth}')
+
+
 class PandocExecutor(ExternalTool):
     """
     Pandoc wrapper for Markdown conversion.
@@ -16,38 +57,17 @@ class PandocExecutor(ExternalTool):
     and a convenient API for common conversion operations.
     """
     
+    SEARCH_CATEGORY = 'pandoc'
+    
     def _get_executable_names(self) -> List[str]:
         """Get platform-specific Pandoc executable names."""
-        if platform.system().lower() == 'windows':
+        if IS_WINDOWS:
             return ['pandoc.exe', 'pandoc']
         return ['pandoc']
     
     def _get_search_paths(self) -> List[Path]:
         """Get common Pandoc installation paths."""
-        system = platform.system().lower()
-        paths = []
-        
-        if system == 'windows':
-            paths.extend([
-                Path('C:/Program Files/Pandoc'),
-                Path('C:/Program Files (x86)/Pandoc'),
-                Path.home() / 'AppData' / 'Local' / 'Pandoc',
-            ])
-        elif system == 'darwin':  # macOS
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/opt/homebrew/bin'),
-            ])
-        else:  # Linux
-            paths.extend([
-                Path('/usr/bin'),
-                Path('/usr/local/bin'),
-            ])
-        
-        # Common paths
-        paths.append(Path.home() / '.local' / 'bin')
-        
-        return paths
+        return list(search_paths(self.SEARCH_CATEGORY))
     
     def convert_markdown_to_html(
         self,
@@ -80,39 +100,69 @@ class PandocExecutor(ExternalTool):
         Returns:
             True if conversion succeeded, False otherwise
         """
-        # Build format string with extensions
-        if extensions:
-            format_str = f"{markdown_format}+{'+'.join(extensions)}"
-        else:
-            format_str = markdown_format
-        
         args = [
-            str(input_file),
-            '-f', format_str,
-            '-t', 'html5',
-            '-o', str(output_file)
+            os.fspath(input_file),
+            '-o', os.fspath(output_file),
+            *self._build_html_args(
+                markdown_format, extensions, standalone, toc, toc_depth,
+                highlight_style, resource_path, extra_args
+            ),
         ]
         
-        if standalone:
-            args.append('--standalone')
-        
-        if toc:
-            args.extend(['--toc', f'--toc-depth={toc_depth}'])
-        
-        if highlight_style:
-            args.extend(['--highlight-style', highlight_style])
-        
-        if resource_path:
-            args.extend(['--resource-path', str(resource_path)])
+        result = self.execute(args, check=False)
+        return result.success
+    
+    def convert_string_to_html(
+        self,
+        markdown: str,
+        markdown_format: str = 'markdown',
+        extensions: Optional[List[str]] = None,
+        standalone: bool = True,
+        toc: bool = True,
+        toc_depth: int = 3,
+        highlight_style: str = 'pygments',
+        resource_path: Optional[Path] = None,
+        extra_args: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Convert a Markdown string to HTML, streaming through stdin/stdout.
         
-        # Add mathjax for math rendering
-        args.append('--mathjax')
+        Same options as convert_markdown_to_html(), but no intermediate
+        files are written or read.
         
-        if extra_args:
-            args.extend(extra_args)
+        Returns:
+            HTML string if conversion succeeded, None otherwise
+        """
+        args = self._build_html_args(
+            markdown_format, extensions, standalone, toc, toc_depth,
+            highlight_style, resource_path, extra_args
+        )
         
-        result = self.execute(args, check=False)
-        return result.success
+        result = self.execute(args, input_text=markdown, check=False, encoding='utf-8')
+        return result.stdout if result.success else None
+    
+    def _build_html_args(
+        self,
+        markdown_format: str,
+        extensions: Optional[List[str]],
+        standalone: bool,
+        toc: bool,
+        toc_depth: int,
+        highlight_style: str,
+        resource_path: Optional[Path],
+        extra_args: Optional[List[str]]
+    ) -> List[str]:
+        """Build Markdown → HTML5 arguments (without input/output paths)."""
+        # mathjax is always on for math rendering
+        return [
+            '-f', _format_string(markdown_format, tuple(extensions or ())),
+            *_HTML_TARGET_ARGS,
+            *(('--standalone',) if standalone else ()),
+            *(_toc_flags(toc_depth) if toc else ()),
+            *(('--highlight-style', highlight_style) if highlight_style else ()),
+            *(('--resource-path', os.fspath(resource_path)) if resource_path else ()),
+            *(extra_args or ()),
+        ]
     
     def convert_markdown_to_docx(
         self,
@@ -145,30 +195,18 @@ class PandocExecutor(ExternalTool):
         Returns:
             True if conversion succeeded, False otherwise
         """
-        # Build format string
-        if extensions:
-            format_str = f"{markdown_format}+{'+'.join(extensions)}"
-        else:
-            format_str = markdown_format
-        
         args = [
-            str(input_file),
-            '-f', format_str,
-            '-t', 'docx',
-            '-o', str(output_file)
+            os.fspath(input_file),
+            '-f', _format_string(markdown_format, tuple(extensions or ())),
+            *_DOCX_TARGET_ARGS,
+            '-o', os.fspath(output_file),
+            *(_toc_flags(toc_depth) if toc else ()),
+            *(('--highlight-style', highlight_style) if highlight_style else ()),
+            *(('--resource-path', os.fspath(resource_path)) if resource_path else ()),
         ]
         
-        if toc:
-            args.extend(['--toc', f'--toc-depth={toc_depth}'])
-        
-        if highlight_style:
-            args.extend(['--highlight-style', highlight_style])
-        
-        if resource_path:
-            args.extend(['--resource-path', str(resource_path)])
-        
-        if reference_docx and reference_docx.exists():
-            args.extend(['--reference-doc', str(reference_docx)])
+        if reference_docx and _stat_cache.exists(str(reference_docx)):
+            args.extend(('--reference-doc', os.fspath(reference_docx)))
         
         if extra_args:
             args.extend(extra_args)
@@ -183,18 +221,5 @@ class PandocExecutor(ExternalTool):
         Returns:
             List of extension names for feature-rich markdown parsing
         """
-        return [
-            'pipe_tables',
-            'backtick_code_blocks',
-            'fenced_code_attributes',
-            'smart',
-            'tex_math_dollars',  # $...$ and $$...$$
-            'tex_math_double_backslash',  # \[...\] and \(...\)
-            'raw_html',
-            'fenced_code_blocks',
-            'autolink_bare_uris',
-            'strikeout',  # ~~text~~
-            'superscript',  # ^text^
-            'subscript',  # ~text~
-        ]
+        return list(DEFAULT_MARKDOWN_EXTENSIONS)
 
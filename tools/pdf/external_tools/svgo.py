@@ -3,8 +3,9 @@ SVGO wrapper for SVG optimization.
 """
 from pathlib import Path
 from typing import List, Optional
-import platform
 
+from ._paths import search_paths
+from ._platform import IS_WINDOWS
 from .base import ExternalTool, CommandResult
 
 
@@ -16,37 +17,17 @@ class SvgoCLI(ExternalTool):
     reducing file size by 30-50% without quality loss.
     """
     
+    SEARCH_CATEGORY = 'npm'
+    
     def _get_executable_names(self) -> List[str]:
         """Get platform-specific svgo executable names."""
-        if platform.system().lower() == 'windows':
+        if IS_WINDOWS:
             return ['svgo.cmd', 'svgo.exe', 'svgo']
         return ['svgo']
     
     def _get_search_paths(self) -> List[Path]:
         """Get common SVGO installation paths (npm global)."""
-        system = platform.system().lower()
-        paths = []
-        
-        if system == 'windows':
-            paths.extend([
-                Path.home() / 'AppData' / 'Roaming' / 'npm',
-                Path('C:/Program Files/nodejs'),
-            ])
-        elif system == 'darwin':
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/opt/homebrew/bin'),
-                Path.home() / '.npm-global' / 'bin',
-            ])
-        else:  # Linux
-            paths.extend([
-                Path('/usr/local/bin'),
-                Path('/usr/bin'),
-                Path.home() / '.npm-global' / 'bin',
-                Path.home() / '.local' / 'bin',
-            ])
-        
-        return paths
+        return list(search_paths(self.SEARCH_CATEGORY))
     
     def optimize(
         self,
@@ -80,12 +61,13 @@ class SvgoCLI(ExternalTool):
         
         return self.execute(args, timeout=timeout, check=False)
     
-    def is_available(self) -> bool:
+    def _check_available(self) -> bool:
         """
         Check if SVGO is available.
         
         SVGO is optional - if not available, diagrams will work
-        but won't be optimized.
+        but won't be optimized. Callers use is_available(), which
+        caches this result.
         
         Returns:
             True if SVGO can be executed
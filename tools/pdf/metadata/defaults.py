@@ -1,11 +1,29 @@
 """
 Default metadata values with environment variable support.
 """
+import copy
 import os
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
 from .models import DocumentMetadata
 
 
+@lru_cache(maxsize=8)
+def _build_defaults(author: str, organization: str, department: Optional[str]) -> DocumentMetadata:
+    """Build the defaults once per distinct set of environment values."""
+    return DocumentMetadata(
+        title="Untitled Document",  # Will be extracted from H1
+        author=author,
+        organization=organization,
+        date=datetime.now().strftime('%B %Y'),
+        version='1.0',
+        type='Technical Document',
+        classification='',  # Not all documents are classified
+        department=department,  # Optional
+    )
+
+
 class MetadataDefaults:
     """
     Provide default metadata values with environment variable support.
@@ -26,19 +44,27 @@ class MetadataDefaults:
         """
         Get default metadata with environment variable fallbacks.
         
+        The result is memoized per process (keyed on the environment
+        variables), so the date is fixed at first use; long-running
+        services should call clear_cache() when the month rolls over.
+        
         Returns:
             DocumentMetadata with defaults applied
         """
-        return DocumentMetadata(
-            title="Untitled Document",  # Will be extracted from H1
-            author=os.environ.get('USER_NAME', 'Author Name'),
-            organization=os.environ.get('ORGANIZATION', 'Organization'),
-            date=datetime.now().strftime('%B %Y'),
-            version='1.0',
-            type='Technical Document',
-            classification='',  # Not all documents are classified
-            department=os.environ.get('DEPARTMENT'),  # Optional
+        cached = _build_defaults(
+            os.environ.get('USER_NAME', 'Author Name'),
+            os.environ.get('ORGANIZATION', 'Organization'),
+            os.environ.get('DEPARTMENT'),
         )
+        # Fresh instance (and custom dict) so callers can't alter the cache
+        defaults = copy.copy(cached)
+        defaults.custom = {}
+        return defaults
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget memoized defaults (e.g. so the date is recomputed)."""
+        _build_defaults.cache_clear()
     
     @staticmethod
     def get_env_overrides() -> dict:
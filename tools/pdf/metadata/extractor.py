@@ -2,9 +2,19 @@
 Extract YAML frontmatter from Markdown files.
 Handles both YAML and TOML frontmatter formats.
 """
+import copy
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Dict, Any
-import yaml
+
+try:
+    import yaml
+    # libyaml-backed loader when PyYAML was built with it (several times faster)
+    _SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+except ImportError:
+    yaml = None
+    _SafeLoader = None
 
 try:
     import tomli  # Python 3.11+ has tomllib built-in
@@ -37,9 +47,15 @@ class MetadataExtractor:
         
         Returns:
             Tuple of (metadata dict, cleaned content without frontmatter)
+        
+        Results are memoized per (path, mtime, size), so a file read again
+        later in the same run isn't re-parsed unless it changed.
         """
-        content = Path(md_file).read_text(encoding='utf-8')
-        return self.extract_from_string(content)
+        path = os.path.abspath(md_file)
+        st = os.stat(path)
+        metadata, content = _extract_cached(path, st.st_mtime_ns, st.st_size)
+        # Callers may edit the dict; keep the cached copy pristine
+        return copy.deepcopy(metadata), content
     
     def extract_from_string(self, md_content: str) -> Tuple[Dict[str, Any], str]:
         """
@@ -67,13 +83,18 @@ class MetadataExtractor:
     
     def _extract_yaml(self, md_content: str) -> Tuple[Dict[str, Any], str]:
         """Extract YAML frontmatter"""
-        parts = md_content.split('---', 2)
-        if len(parts) < 3:
+        if yaml is None:
+            raise ImportError("YAML support requires 'pyyaml' package: pip install pyyaml")
+        
+        # Locate the closing fence instead of split(), which would copy the
+        # whole body into a throwaway list item
+        end = md_content.find('---', 3)
+        if end == -1:
             return {}, md_content
         
         try:
-            metadata = yaml.safe_load(parts[1])
-            content = parts[2].strip()
+            metadata = yaml.load(md_content[3:end], Loader=_SafeLoader)
+            content = md_content[end + 3:].strip()
             return metadata if metadata else {}, content
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML frontmatter: {e}")
@@ -83,14 +104,20 @@ class MetadataExtractor:
         if tomli is None:
             raise ImportError("TOML support requires 'tomli' package: pip install tomli")
         
-        parts = md_content.split('+++', 2)
-        if len(parts) < 3:
+        end = md_content.find('+++', 3)
+        if end == -1:
             return {}, md_content
         
         try:
-            metadata = tomli.loads(parts[1])
-            content = parts[2].strip()
+            metadata = tomli.loads(md_content[3:end])
+            content = md_content[end + 3:].strip()
             return metadata, content
         except Exception as e:
             raise ValueError(f"Invalid TOML frontmatter: {e}")
 
+
+@lru_cache(maxsize=4096)
+def _extract_cached(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], str]:
+    """Read and parse a file; mtime/size are only part of the cache key."""
+    content = Path(path).read_text(encoding='utf-8')
+    return MetadataExtractor().extract_from_string(content)
@@ -1,10 +1,29 @@
 """
 Inject metadata as HTML <meta> tags for Playwright renderer.
 """
+import os
 from pathlib import Path
 from .models import DocumentMetadata
 
 
+# Characters escaped in meta tag attribute values (one translate() pass)
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+
+# DocumentMetadata attributes emitted as <meta name="..."> (in tag order):
+# standard fields, then optional enhanced fields
+_META_FIELDS = (
+    'title', 'author', 'organization', 'date', 'version', 'type', 'classification',
+    'department', 'review_status', 'doc_id', 'prepared_for',
+)
+
+
 class HTMLMetadataInjector:
     """
     Inject metadata as HTML <meta> tags for Playwright PDF pipeline.
@@ -25,9 +44,19 @@ class HTMLMetadataInjector:
             html_file: Path to HTML file to modify
             metadata: Metadata to inject
         """
-        html_content = Path(html_file).read_text(encoding='utf-8')
-        modified_html = self.inject_into_string(html_content, metadata)
-        Path(html_file).write_text(modified_html, encoding='utf-8')
+        meta_tags = self._generate_meta_tags(metadata)
+        if not meta_tags:
+            return
+        
+        # Splice the encoded tags into the raw bytes: the document itself is
+        # never decoded/re-encoded. Write to a sibling file and swap it in.
+        html_file = Path(html_file)
+        meta_html = '\n    '.join(meta_tags).encode('utf-8')
+        modified_html = _insert_meta_html(html_file.read_bytes(), meta_html)
+        
+        tmp_file = html_file.with_name(f'{html_file.name}.{os.getpid()}.tmp')
+        tmp_file.write_bytes(modified_html)
+        os.replace(tmp_file, html_file)
     
     def inject_into_string(self, html_content: str, metadata: DocumentMetadata) -> str:
         """
@@ -47,63 +76,62 @@ class HTMLMetadataInjector:
         
         meta_html = '\n    '.join(meta_tags)
         
-        # Try to insert into <head>
-        if '<head>' in html_content:
-            return html_content.replace('<head>', f'<head>\n    {meta_html}', 1)
-        elif '</head>' in html_content:
-            return html_content.replace('</head>', f'    {meta_html}\n</head>', 1)
-        elif '<html>' in html_content:
-            # No head tag, create one
-            return html_content.replace('<html>', f'<html>\n<head>\n    {meta_html}\n</head>', 1)
-        else:
-            # No html tag either, prepend
-            return f'<!DOCTYPE html>\n<html>\n<head>\n    {meta_html}\n</head>\n<body>\n{html_content}\n</body>\n</html>'
+        return _insert_meta_html(html_content, meta_html)
     
     def _generate_meta_tags(self, metadata: DocumentMetadata) -> list:
         """Generate HTML <meta> tags from metadata"""
+        escape = self._escape_html
         meta_tags = []
         
-        # Standard fields
-        if metadata.title:
-            meta_tags.append(f'<meta name="title" content="{self._escape_html(metadata.title)}" />')
-        if metadata.author:
-            meta_tags.append(f'<meta name="author" content="{self._escape_html(metadata.author)}" />')
-        if metadata.organization:
-            meta_tags.append(f'<meta name="organization" content="{self._escape_html(metadata.organization)}" />')
-        if metadata.date:
-            meta_tags.append(f'<meta name="date" content="{self._escape_html(metadata.date)}" />')
-        if metadata.version:
-            meta_tags.append(f'<meta name="version" content="{self._escape_html(metadata.version)}" />')
-        if metadata.type:
-            meta_tags.append(f'<meta name="type" content="{self._escape_html(metadata.type)}" />')
-        if metadata.classification:
-            meta_tags.append(f'<meta name="classification" content="{self._escape_html(metadata.classification)}" />')
-        
-        # Optional enhanced fields
-        if metadata.department:
-            meta_tags.append(f'<meta name="department" content="{self._escape_html(metadata.department)}" />')
-        if metadata.review_status:
-            meta_tags.append(f'<meta name="review_status" content="{self._escape_html(metadata.review_status)}" />')
-        if metadata.doc_id:
-            meta_tags.append(f'<meta name="doc_id" content="{self._escape_html(metadata.doc_id)}" />')
-        if metadata.prepared_for:
-            meta_tags.append(f'<meta name="prepared_for" content="{self._escape_html(metadata.prepared_for)}" />')
+        for name in _META_FIELDS:
+            value = getattr(metadata, name)
+            if value:
+                meta_tags.append(f'<meta name="{name}" content="{escape(value)}" />')
         
         # Custom fields
         for key, value in metadata.custom.items():
             if value:
-                meta_tags.append(f'<meta name="{self._escape_html(key)}" content="{self._escape_html(str(value))}" />')
+                meta_tags.append(f'<meta name="{escape(key)}" content="{escape(str(value))}" />')
         
         return meta_tags
     
     def _escape_html(self, text: str) -> str:
         """Escape HTML entities for safe injection"""
-        return (
-            str(text)
-            .replace('&', '&amp;')
-            .replace('<', '&lt;')
-            .replace('>', '&gt;')
-            .replace('"', '&quot;')
-            .replace("'", '&#x27;')
-        )
+        return str(text).translate(_HTML_ESCAPES)
+
 
+def _insert_meta_html(html_content, meta_html):
+    """
+    Insert joined meta tags into <head>, creating a head/document if needed.
+    
+    Works on str or bytes (both arguments the same type). Slices at the
+    first match rather than testing membership and then replacing, which
+    would scan twice.
+    """
+    if isinstance(html_content, bytes):
+        def lit(text):
+            return text.encode('utf-8')
+    else:
+        def lit(text):
+            return text
+    
+    index = html_content.find(lit('<head>'))
+    if index != -1:
+        index += len('<head>')
+        return lit('').join((html_content[:index], lit('\n    '), meta_html, html_content[index:]))
+    
+    index = html_content.find(lit('</head>'))
+    if index != -1:
+        return lit('').join((html_content[:index], lit('    '), meta_html, lit('\n'), html_content[index:]))
+    
+    index = html_content.find(lit('<html>'))
+    if index != -1:
+        # No head tag, create one
+        index += len('<html>')
+        return lit('').join((html_content[:index], lit('\n<head>\n    '), meta_html, lit('\n</head>'), html_content[index:]))
+    
+    # No html tag either, prepend
+    return lit('').join((
+        lit('<!DOCTYPE html>\n<html>\n<head>\n    '), meta_html,
+        lit('\n</head>\n<body>\n'), html_content, lit('\n</body>\n</html>'),
+    ))
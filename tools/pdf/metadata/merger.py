@@ -46,13 +46,10 @@ class MetadataMerger:
         else:
             merged = defaults.to_dict(include_none=False)
         
-        # Merge frontmatter (overrides defaults)
-        if frontmatter:
-            merged.update({k: v for k, v in frontmatter.items() if v is not None})
-        
-        # Merge CLI/web overrides (highest priority)
-        if overrides:
-            merged.update({k: v for k, v in overrides.items() if v is not None})
+        # Frontmatter overrides defaults; CLI/web overrides win over both
+        for source in (frontmatter, overrides):
+            if source:
+                merged.update((k, v) for k, v in source.items() if v is not None)
         
         # Create DocumentMetadata from merged dict
         return DocumentMetadata.from_dict(merged)
@@ -7,6 +7,13 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 
 
+# Frontmatter keys that map to DocumentMetadata fields (everything else is custom)
+_KNOWN_FIELDS = frozenset({
+    'title', 'author', 'organization', 'date', 'version', 'type', 'classification',
+    'department', 'review_status', 'doc_id', 'document_id', 'prepared_for', 'preparedFor'
+})
+
+
 @dataclass
 class DocumentMetadata:
     """
@@ -71,6 +78,41 @@ class DocumentMetadata:
         """
         Convert to dictionary for JSON serialization.
         
+        Built field by field rather than with asdict(), which deep-copies
+        recursively; custom is copied one level deep. Use to_dict_deep()
+        when nested custom values must not be shared.
+        
+        Args:
+            include_none: If True, include fields with None values
+        
+        Returns:
+            Dictionary representation
+        """
+        data = {
+            'title': self.title,
+            'author': self.author,
+            'organization': self.organization,
+            'date': self.date,
+            'version': self.version,
+            'type': self.type,
+            'classification': self.classification,
+            'department': self.department,
+            'review_status': self.review_status,
+            'doc_id': self.doc_id,
+            'document_id': self.document_id,
+            'prepared_for': self.prepared_for,
+            'preparedFor': self.preparedFor,
+            'custom': dict(self.custom),
+        }
+        if not include_none:
+            # Remove None values
+            data = {k: v for k, v in data.items() if v is not None}
+        return data
+    
+    def to_dict_deep(self, include_none: bool = False) -> Dict[str, Any]:
+        """
+        Like to_dict(), but with nested values deep-copied (dataclasses.asdict).
+        
         Args:
             include_none: If True, include fields with None values
         
@@ -95,18 +137,18 @@ class DocumentMetadata:
         Returns:
             DocumentMetadata instance
         """
-        # Separate known fields from custom fields
-        known_fields = {
-            'title', 'author', 'organization', 'date', 'version', 'type', 'classification',
-            'department', 'review_status', 'doc_id', 'document_id', 'prepared_for', 'preparedFor'
-        }
-        
-        known_data = {k: v for k, v in data.items() if k in known_fields}
-        custom_data = {k: v for k, v in data.items() if k not in known_fields and k != 'custom'}
+        # Separate known fields from custom fields in one pass
+        known_data, custom_data = {}, {}
+        for k, v in data.items():
+            if k in _KNOWN_FIELDS:
+                known_data[k] = v
+            else:
+                custom_data[k] = v
         
         # Merge existing custom data if present
-        if 'custom' in data and isinstance(data['custom'], dict):
-            custom_data.update(data['custom'])
+        existing_custom = custom_data.pop('custom', None)
+        if isinstance(existing_custom, dict):
+            custom_data.update(existing_custom)
         
         return cls(**known_data, custom=custom_data)
     
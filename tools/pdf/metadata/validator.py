@@ -2,10 +2,43 @@
 Validate and sanitize metadata to prevent PDF generation errors.
 """
 import re
-from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any
 
 
+# Characters that can break PDF metadata
+_UNSAFE_CHARS_RE = re.compile(r'[<>]')
+
+# Control characters (except tab, newline and carriage return), deleted
+# with str.translate: a table lookup per character instead of regex matching
+_CTRL_CHARS_TABLE = dict.fromkeys([*range(0x00, 0x09), 0x0b, 0x0c, *range(0x0e, 0x20), 0x7f])
+
+
+# Free-text fields run through _sanitize_string
+_STRING_FIELDS = (
+    'title', 'author', 'organization', 'type', 'department',
+    'review_status', 'doc_id', 'document_id', 'prepared_for', 'preparedFor'
+)
+
+
+# Sanitizers are pure functions of the string value; authors, organizations
+# and classifications repeat across a batch, so memoize them.
+
+@lru_cache(maxsize=4096)
+def _sanitize_version_cached(version: str) -> str:
+    return _UNSAFE_CHARS_RE.sub('', version)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_classification_cached(classification: str) -> str:
+    return classification.strip().upper()
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_string_cached(value: str) -> str:
+    return value.strip().translate(_CTRL_CHARS_TABLE)
+
+
 class MetadataValidator:
     """
     Validate and sanitize metadata fields.
@@ -23,10 +56,7 @@ class MetadataValidator:
     """
     
     # Characters that can break PDF metadata
-    UNSAFE_CHARS_PATTERN = r'[<>]'
-    
-    # Common date formats to try
-    DATE_FORMATS = ['%B %Y', '%Y-%m-%d', '%m/%d/%Y', '%d %B %Y', '%Y-%m', '%B %d, %Y']
+    UNSAFE_CHARS_PATTERN = _UNSAFE_CHARS_RE.pattern
     
     def validate(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -36,78 +66,74 @@ class MetadataValidator:
             metadata: Raw metadata dictionary
         
         Returns:
-            Sanitized metadata dictionary
+            Sanitized metadata dictionary. The input dict itself is returned
+            when no field needed changing (copy-on-write), so treat the
+            result as read-only or copy it before mutating.
         """
         if not metadata:
             return {}
         
-        validated = metadata.copy()
+        changes = {}
+        
+        def sanitize(field: str, sanitizer) -> None:
+            value = metadata.get(field)
+            if value:
+                sanitized = sanitizer(value)
+                if sanitized != value:
+                    changes[field] = sanitized
         
         # Sanitize version field
-        if 'version' in validated and validated['version']:
-            validated['version'] = self._sanitize_version(validated['version'])
+        sanitize('version', self._sanitize_version)
         
         # Validate date format
-        if 'date' in validated and validated['date']:
-            validated['date'] = self._sanitize_date(validated['date'])
+        sanitize('date', self._sanitize_date)
         
         # Normalize classification
-        if 'classification' in validated and validated['classification']:
-            validated['classification'] = self._normalize_classification(validated['classification'])
+        sanitize('classification', self._normalize_classification)
         
         # Sanitize string fields
-        string_fields = [
-            'title', 'author', 'organization', 'type', 'department',
-            'review_status', 'doc_id', 'document_id', 'prepared_for', 'preparedFor'
-        ]
-        for field in string_fields:
-            if field in validated and validated[field]:
-                validated[field] = self._sanitize_string(validated[field])
+        for field in _STRING_FIELDS:
+            sanitize(field, self._sanitize_string)
         
-        return validated
+        # Copy only if something actually changed
+        return {**metadata, **changes} if changes else metadata
     
     def _sanitize_version(self, version: Any) -> str:
         """
         Remove characters that could break PDF metadata.
         Example: "v1.0<test>" -> "v1.0test"
         """
-        version_str = str(version)
-        return re.sub(self.UNSAFE_CHARS_PATTERN, '', version_str)
+        version = str(version)
+        # Substring checks are cheaper than a regex pass or cache lookup
+        if '<' not in version and '>' not in version:
+            return version
+        return _sanitize_version_cached(version)
     
     def _sanitize_date(self, date: Any) -> str:
         """
-        Validate date format and allow freeform dates.
-        Try to parse common formats but don't fail if unparseable.
-        """
-        date_str = str(date)
+        Coerce date to string; freeform dates are allowed.
         
-        # Try to parse common formats (validates structure)
-        for fmt in self.DATE_FORMATS:
-            try:
-                datetime.strptime(date_str, fmt)
-                return date_str  # Valid format
-            except ValueError:
-                continue
-        
-        # Allow freeform dates (e.g., "Q4 2025", "Winter 2024")
-        return date_str
+        The value is passed through unchanged (e.g. "December 2025",
+        "2025-12-01", "Q4 2025"), so no format parsing is attempted.
+        """
+        return str(date)
     
     def _normalize_classification(self, classification: Any) -> str:
         """
         Normalize classification string (uppercase, trimmed).
         Example: "confidential  " -> "CONFIDENTIAL"
         """
-        return str(classification).strip().upper()
+        classification = str(classification)
+        # Already-normalized values ("CONFIDENTIAL") are the common case
+        if classification.isupper() and classification == classification.strip():
+            return classification
+        return _normalize_classification_cached(classification)
     
     def _sanitize_string(self, value: Any) -> str:
         """
         Ensure proper string encoding and remove control characters.
         Prevents XSS in HTML meta tags.
         """
-        value_str = str(value).strip()
-        
         # Remove control characters (except newline/tab)
-        value_str = re.sub(r'[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]', '', value_str)
-        
-        return value_str
+        return _sanitize_string_cached(str(value))
 
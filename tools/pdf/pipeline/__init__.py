@@ -41,6 +41,12 @@ Usage:
     ])
 """
 
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
 from .base import (
     PipelineContext,
     PipelineStep,
@@ -53,6 +59,8 @@ from .config import (
     OutputFormat,
 )
 
+from .output_cache import OutputCache
+
 from .steps import (
     # Preprocessing
     ReadContentStep,
@@ -113,6 +121,50 @@ __all__ = [
 ]
 
 
+# ignore_cleanup_errors is only available on Python 3.10+
+_TEMPDIR_KWARGS = {'ignore_cleanup_errors': True} if sys.version_info >= (3, 10) else {}
+
+# Step classes shared by every pipeline, and the per-format steps that
+# follow the optional glossary/math steps
+_CORE_STEPS = (ReadContentStep, MetadataExtractionStep)
+
+_PDF_TAIL = (
+    DiagramRenderingStep,
+    PandocConversionStep,
+    ImagePathCorrectionStep,  # Fix diagram paths after Pandoc
+    MermaidEnhancementStep,
+    CSSStrippingStep,
+    TitlePageInjectionStep,
+    MetadataInjectionStep,
+    PdfRenderingStep,
+)
+
+_DOCX_TAIL = (
+    DiagramRenderingStep,
+    DocxRenderingStep,
+)
+
+_HTML_TAIL = (
+    DiagramRenderingStep,
+    PandocConversionStep,
+    ImagePathCorrectionStep,  # Fix diagram paths
+    MermaidEnhancementStep,
+    CSSStrippingStep,
+    HtmlRenderingStep,
+)
+
+
+def _build_steps(tail: Tuple[type, ...], include_glossary: bool, include_math: bool) -> List[PipelineStep]:
+    """Instantiate core steps, optional glossary/math steps, then tail"""
+    classes = list(_CORE_STEPS)
+    if include_glossary:
+        classes.append(GlossaryExpansionStep)
+    if include_math:
+        classes.append(MathRenderingStep)
+    classes.extend(tail)
+    return [cls() for cls in classes]
+
+
 def create_pdf_pipeline(include_math: bool = True, include_glossary: bool = True) -> Pipeline:
     """
     Create a standard PDF generation pipeline.
@@ -147,29 +199,10 @@ def create_pdf_pipeline(include_math: bool = True, include_glossary: bool = True
         )
         success = pipeline.execute(context)
     """
-    steps = [
-        ReadContentStep(),
-        MetadataExtractionStep(),
-    ]
-    
-    if include_glossary:
-        steps.append(GlossaryExpansionStep())
-    
-    if include_math:
-        steps.append(MathRenderingStep())
-    
-    steps.extend([
-        DiagramRenderingStep(),
-        PandocConversionStep(),
-        ImagePathCorrectionStep(),  # NEW: Fix diagram paths after Pandoc
-        MermaidEnhancementStep(),
-        CSSStrippingStep(),
-        TitlePageInjectionStep(),
-        MetadataInjectionStep(),
-        PdfRenderingStep(),
-    ])
-    
-    return Pipeline(steps, name="PDF Generation")
+    return Pipeline(
+        _build_steps(_PDF_TAIL, include_glossary, include_math),
+        name="PDF Generation"
+    )
 
 
 def create_docx_pipeline(include_glossary: bool = True) -> Pipeline:
@@ -182,20 +215,10 @@ def create_docx_pipeline(include_glossary: bool = True) -> Pipeline:
     Returns:
         Configured Pipeline for DOCX generation
     """
-    steps = [
-        ReadContentStep(),
-        MetadataExtractionStep(),
-    ]
-    
-    if include_glossary:
-        steps.append(GlossaryExpansionStep())
-    
-    steps.extend([
-        DiagramRenderingStep(),
-        DocxRenderingStep(),
-    ])
-    
-    return Pipeline(steps, name="DOCX Generation")
+    return Pipeline(
+        _build_steps(_DOCX_TAIL, include_glossary, include_math=False),
+        name="DOCX Generation"
+    )
 
 
 def create_html_pipeline(include_math: bool = True, include_glossary: bool = True) -> Pipeline:
@@ -209,27 +232,39 @@ def create_html_pipeline(include_math: bool = True, include_glossary: bool = Tru
     Returns:
         Configured Pipeline for HTML generation
     """
-    steps = [
-        ReadContentStep(),
-        MetadataExtractionStep(),
-    ]
-    
-    if include_glossary:
-        steps.append(GlossaryExpansionStep())
-    
-    if include_math:
-        steps.append(MathRenderingStep())
-    
-    steps.extend([
-        DiagramRenderingStep(),
-        PandocConversionStep(),
-        ImagePathCorrectionStep(),  # NEW: Fix diagram paths
-        MermaidEnhancementStep(),
-        CSSStrippingStep(),
-        HtmlRenderingStep(),
-    ])
-    
-    return Pipeline(steps, name="HTML Generation")
+    return Pipeline(
+        _build_steps(_HTML_TAIL, include_glossary, include_math),
+        name="HTML Generation"
+    )
+
+
+# Standard pipelines used by process_document, one per format. Steps keep
+# no per-document state (everything lives on the PipelineContext), so a
+# pipeline can be executed any number of times. Callers wanting custom
+# steps should build their own with create_*_pipeline().
+_default_pipelines: Dict[OutputFormat, Pipeline] = {}
+
+
+def _get_default_pipeline(output_format: OutputFormat) -> Pipeline:
+    """Return the shared standard pipeline for a format, building it once"""
+    pipeline = _default_pipelines.get(output_format)
+    if pipeline is None:
+        if output_format == OutputFormat.PDF:
+            pipeline = create_pdf_pipeline()
+        elif output_format == OutputFormat.DOCX:
+            pipeline = create_docx_pipeline()
+        else:
+            pipeline = create_html_pipeline()
+        _default_pipelines[output_format] = pipeline
+    return pipeline
+
+
+def _cleanup_work_dir(work_dir: tempfile.TemporaryDirectory) -> None:
+    """Remove a finished document's work directory"""
+    try:
+        work_dir.cleanup()
+    except OSError:
+        pass
 
 
 def process_document(
@@ -245,7 +280,10 @@ def process_document(
         input_file: Path to input Markdown file
         output_file: Path to output file
         output_format: Target format (PDF, DOCX, HTML)
-        **kwargs: Additional configuration options
+        **kwargs: Additional configuration options. With cache_outputs and
+                  cache_dir set, finished PDF/DOCX outputs are cached under
+                  <cache_dir>/outputs and reused for unchanged inputs
+                  (documents referencing local files are always rendered).
     
     Returns:
         True if processing succeeded
@@ -259,30 +297,49 @@ def process_document(
             generate_cover=True
         )
     """
-    import tempfile
-    from pathlib import Path
-    
-    # Select pipeline based on format
-    if output_format == OutputFormat.PDF:
-        pipeline = create_pdf_pipeline()
-    elif output_format == OutputFormat.DOCX:
-        pipeline = create_docx_pipeline()
-    else:
-        pipeline = create_html_pipeline()
+    # Whole-document cache: identical input + options -> copy the last output
+    output_cache = cache_key = raw_content = None
+    if kwargs.get('cache_outputs') and kwargs.get('cache_dir') and output_format != OutputFormat.HTML:
+        source = Path(input_file).read_bytes()
+        # Hand the text to ReadContentStep rather than reading the file
+        # twice; newlines are translated as read_text() would
+        try:
+            raw_content = source.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        except UnicodeDecodeError:
+            pass  # Let ReadContentStep report the unreadable file
+        if OutputCache.is_cacheable(source):
+            output_cache = OutputCache(kwargs['cache_dir'])
+            cache_key = output_cache.compute_key(source, output_format.value, kwargs)
+            if output_cache.restore(cache_key, Path(output_file)):
+                if kwargs.get('verbose', False):
+                    print(f"[CACHE] Reused cached output for {input_file}")
+                return True
+    
+    pipeline = _get_default_pipeline(output_format)
+    
+    work_dir = tempfile.TemporaryDirectory(prefix='doc_', **_TEMPDIR_KWARGS)
     
     # Create context
     context = PipelineContext(
         input_file=Path(input_file),
         output_file=Path(output_file),
-        work_dir=Path(tempfile.mkdtemp(prefix='doc_')),
+        work_dir=Path(work_dir.name),
+        raw_content=raw_content,
         config=kwargs,
         verbose=kwargs.get('verbose', False)
     )
     
     try:
-        return pipeline.execute(context)
+        success = pipeline.execute(context)
+        if success and output_cache is not None:
+            output_cache.store(cache_key, Path(output_file))
+        return success
     finally:
-        # Cleanup work directory
-        import shutil
-        if context.work_dir.exists():
-            shutil.rmtree(context.work_dir, ignore_errors=True)
+        # Delete the work directory off the caller's critical path. The
+        # thread is non-daemon, so interpreter (and pool worker) shutdown
+        # waits for pending deletions instead of leaving temp dirs behind.
+        threading.Thread(
+            target=_cleanup_work_dir,
+            args=(work_dir,),
+            name='doc-workdir-cleanup'
+        ).start()
@@ -9,10 +9,17 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Callable
 from dataclasses import dataclass, field
-from datetime import datetime
+import sys
+import time
 
+# Slotted dataclasses need Python 3.10; on 3.9 the context keeps a __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# Context fields that accept a str and are normalised to Path
+_PATH_FIELDS = ('input_file', 'output_file', 'work_dir')
+
+
+@dataclass(**_SLOTS)
 class PipelineContext:
     """
     Shared context object passed through pipeline steps.
@@ -57,17 +64,15 @@ class PipelineContext:
     # State tracking
     verbose: bool = False
     step_results: Dict[str, bool] = field(default_factory=dict)
-    start_time: Optional[datetime] = None
+    start_time: Optional[float] = None  # time.monotonic() at creation
     
     def __post_init__(self):
         """Convert string paths to Path objects"""
-        if isinstance(self.input_file, str):
-            self.input_file = Path(self.input_file)
-        if isinstance(self.output_file, str):
-            self.output_file = Path(self.output_file)
-        if isinstance(self.work_dir, str):
-            self.work_dir = Path(self.work_dir)
-        self.start_time = datetime.now()
+        for name in _PATH_FIELDS:
+            value = getattr(self, name)
+            if isinstance(value, str):
+                setattr(self, name, Path(value))
+        self.start_time = time.monotonic()
     
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get configuration value with optional default"""
@@ -75,8 +80,8 @@ class PipelineContext:
     
     def elapsed_time(self) -> float:
         """Get elapsed time in seconds since pipeline started"""
-        if self.start_time:
-            return (datetime.now() - self.start_time).total_seconds()
+        if self.start_time is not None:
+            return time.monotonic() - self.start_time
         return 0.0
 
 
@@ -100,6 +105,10 @@ class PipelineStep(ABC):
                 return True
     """
     
+    # Filled in on first access to ``name``; a class-level default means
+    # subclasses with their own __init__ needn't call super().__init__()
+    _cached_name: Optional[str] = None
+    
     @abstractmethod
     def execute(self, context: PipelineContext) -> bool:
         """
@@ -121,10 +130,18 @@ class PipelineStep(ABC):
         """Get human-readable step name for logging"""
         pass
     
+    @property
+    def name(self) -> str:
+        """Step name from get_name(), computed once per instance"""
+        name = self._cached_name
+        if name is None:
+            name = self._cached_name = self.get_name()
+        return name
+    
     def log(self, message: str, context: PipelineContext) -> None:
         """Log a message if verbose mode enabled"""
         if context.verbose:
-            print(f"    [{self.get_name()}] {message}")
+            print(f"    [{self.name}] {message}")
     
     def validate(self, context: PipelineContext) -> None:
         """
@@ -198,52 +215,59 @@ class Pipeline:
             True if all steps succeeded, False if any failed
         """
         total_steps = len(self.steps)
+        verbose = context.verbose
+        step_results = context.step_results
+        on_step_complete = self._on_step_complete
         
-        if context.verbose:
+        if verbose:
             print(f"\n{'='*60}")
             print(f"{self.name} Pipeline - {total_steps} steps")
             print(f"{'='*60}")
         
         for idx, step in enumerate(self.steps, 1):
-            step_name = step.get_name()
+            step_name = step.name
+            # Most steps inherit the no-op validate()/cleanup(); skip calling them
+            step_type = type(step)
+            has_validate = step_type.validate is not PipelineStep.validate
+            has_cleanup = step_type.cleanup is not PipelineStep.cleanup
             
-            if context.verbose:
+            if verbose:
                 print(f"\n  [{idx}/{total_steps}] {step_name}...")
             
             try:
                 # Validate preconditions
-                step.validate(context)
+                if has_validate:
+                    step.validate(context)
                 
                 # Execute step
                 success = step.execute(context)
                 
                 # Record result
-                context.step_results[step_name] = success
+                step_results[step_name] = success
                 
                 # Cleanup
-                step.cleanup(context)
+                if has_cleanup:
+                    step.cleanup(context)
                 
                 # Callback
-                if self._on_step_complete:
-                    self._on_step_complete(step_name, success)
+                if on_step_complete:
+                    on_step_complete(step_name, success)
                 
                 if not success:
                     print(f"  [ERROR] Step '{step_name}' failed")
                     return False
                     
-            except PipelineError as e:
-                print(f"  [ERROR] Step '{step_name}': {e}")
-                context.step_results[step_name] = False
-                step.cleanup(context)
-                return False
-                
             except Exception as e:
-                print(f"  [ERROR] Step '{step_name}' raised unexpected exception: {e}")
-                context.step_results[step_name] = False
-                step.cleanup(context)
+                if isinstance(e, PipelineError):
+                    print(f"  [ERROR] Step '{step_name}': {e}")
+                else:
+                    print(f"  [ERROR] Step '{step_name}' raised unexpected exception: {e}")
+                step_results[step_name] = False
+                if has_cleanup:
+                    step.cleanup(context)
                 return False
         
-        if context.verbose:
+        if verbose:
             elapsed = context.elapsed_time()
             print(f"\n{'='*60}")
             print(f"Pipeline completed in {elapsed:.2f}s")
@@ -251,6 +275,18 @@ class Pipeline:
         
         return True
     
+    def _find(self, step_name: str) -> Optional[int]:
+        """
+        Position of the first step with this name, or None.
+        
+        self.steps is public and may be edited directly, so it is scanned
+        rather than indexed; step.name is cached, so no get_name() calls.
+        """
+        for i, step in enumerate(self.steps):
+            if step.name == step_name:
+                return i
+        return None
+    
     def add_step(self, step: PipelineStep) -> 'Pipeline':
         """Add a step to the end of the pipeline. Returns self for chaining."""
         self.steps.append(step)
@@ -263,23 +299,21 @@ class Pipeline:
     
     def remove_step(self, step_name: str) -> 'Pipeline':
         """Remove a step by name. Returns self for chaining."""
-        self.steps = [s for s in self.steps if s.get_name() != step_name]
+        if self._find(step_name) is not None:
+            self.steps = [s for s in self.steps if s.name != step_name]
         return self
     
     def replace_step(self, step_name: str, new_step: PipelineStep) -> 'Pipeline':
         """Replace a step by name. Returns self for chaining."""
-        for i, step in enumerate(self.steps):
-            if step.get_name() == step_name:
-                self.steps[i] = new_step
-                break
+        i = self._find(step_name)
+        if i is not None:
+            self.steps[i] = new_step
         return self
     
     def get_step(self, step_name: str) -> Optional[PipelineStep]:
         """Get a step by name"""
-        for step in self.steps:
-            if step.get_name() == step_name:
-                return step
-        return None
+        i = self._find(step_name)
+        return None if i is None else self.steps[i]
     
     def on_step_complete(self, callback: Callable[[str, bool], None]) -> None:
         """Set callback for step completion events"""
@@ -15,6 +15,13 @@ class OutputFormat(Enum):
     HTML = 'html'
 
 
+# Fields that accept a str and are normalised to Path
+_PATH_FIELDS = (
+    'glossary_file', 'cache_dir', 'theme_config', 'crossref_config',
+    'css_file', 'logo_path', 'reference_docx',
+)
+
+
 @dataclass
 class PipelineConfig:
     """
@@ -92,20 +99,10 @@ class PipelineConfig:
     
     def __post_init__(self):
         """Convert string paths to Path objects"""
-        if self.glossary_file and isinstance(self.glossary_file, str):
-            self.glossary_file = Path(self.glossary_file)
-        if self.cache_dir and isinstance(self.cache_dir, str):
-            self.cache_dir = Path(self.cache_dir)
-        if self.theme_config and isinstance(self.theme_config, str):
-            self.theme_config = Path(self.theme_config)
-        if self.crossref_config and isinstance(self.crossref_config, str):
-            self.crossref_config = Path(self.crossref_config)
-        if self.css_file and isinstance(self.css_file, str):
-            self.css_file = Path(self.css_file)
-        if self.logo_path and isinstance(self.logo_path, str):
-            self.logo_path = Path(self.logo_path)
-        if self.reference_docx and isinstance(self.reference_docx, str):
-            self.reference_docx = Path(self.reference_docx)
+        for name in _PATH_FIELDS:
+            value = getattr(self, name)
+            if value and isinstance(value, str):
+                setattr(self, name, Path(value))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for legacy compatibility"""
@@ -0,0 +1,240 @@
+"""
+Whole-document output cache.
+
+Stores finished PDF/DOCX files keyed by everything that determines their
+bytes, so re-converting an unchanged document is a hash and a file copy
+instead of a full Pandoc + Chromium run.
+
+Cache key is SHA-256 of:
+- Markdown source bytes
+- Output format
+- Conversion options (except logging/cache settings)
+- Size and mtime of files named by options (CSS, theme, glossary, ...)
+- Size and mtime of the selected profile's files and the built-in layout CSS
+- Default metadata (month-stamped date, environment author/organization)
+- Pandoc, mmdc and Playwright versions
+
+Documents that reference local files (images, stylesheets, ...) are not
+cached: their contents are resolved by Pandoc and Chromium at render time.
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Bump to invalidate every cached output after a rendering change
+CACHE_VERSION = 2
+
+# Options that don't affect the produced file
+_IGNORED_OPTIONS = frozenset({'verbose', 'cache_dir', 'use_cache', 'cache_outputs'})
+
+# Options naming files whose contents feed into the output
+_FILE_OPTIONS = frozenset({
+    'css_file', 'theme_config', 'glossary_file', 'crossref_config',
+    'logo_path', 'reference_docx',
+})
+
+# Profile fields naming files
+_PROFILE_FILES = ('css', 'logo', 'theme_config', 'reference_docx')
+
+_PDF_TOOLS_DIR = Path(__file__).parent.parent
+_REPO_ROOT = _PDF_TOOLS_DIR.parent.parent
+
+# Pagination CSS injected into every PDF
+_LAYOUT_CSS = _PDF_TOOLS_DIR / 'styles' / 'layout.css'
+
+# Targets of ![alt](target), src="target", <link href="target"> and
+# [ref]: target definitions (used by reference-style images)
+_MD_IMAGE_RE = re.compile(rb'!\[[^\]]*\]\(\s*<?([^)\s>]+)')
+_HTML_ASSET_RE = re.compile(rb'(?:\bsrc|<link\b[^>]*?\bhref)\s*=\s*["\']([^"\']+)', re.IGNORECASE)
+_REF_IMAGE_RE = re.compile(rb'!\[[^\]]*\]\[')
+_REF_DEFINITION_RE = re.compile(rb'^[ ]{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s|$)', re.MULTILINE)
+
+# URLs (scheme:, //host) and in-page anchors aren't local files
+_REMOTE_TARGET_RE = re.compile(rb'^(?:[a-zA-Z][a-zA-Z0-9+.-]*:|//|#)')
+
+
+def _file_state(path: Any) -> Any:
+    """[path, size, mtime_ns] of a file, or the path alone if it's missing"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return str(path)
+    return [str(path), st.st_size, st.st_mtime_ns]
+
+
+def _profile_state(profile_name: str) -> Optional[Dict[str, Any]]:
+    """File states of a profile's assets, resolved as PdfRenderingStep does"""
+    try:
+        from config.profiles import get_profile
+    except ImportError:
+        return None
+    profile = get_profile(profile_name)
+    if not profile:
+        return None
+    state = {}
+    for name in _PROFILE_FILES:
+        value = getattr(profile, name, None)
+        if value:
+            path = Path(value)
+            if not path.is_absolute():
+                path = _REPO_ROOT / path
+            state[name] = _file_state(path)
+    return state
+
+
+@lru_cache(maxsize=None)
+def _tool_version(tool: str) -> Optional[str]:
+    """First line of '<tool> --version', probed once per process"""
+    try:
+        from external_tools import MermaidCLI, PandocExecutor, ToolNotFoundError
+    except ImportError:
+        return None
+    try:
+        executor = PandocExecutor() if tool == 'pandoc' else MermaidCLI()
+        result = executor.execute(['--version'], timeout=30, check=False)
+    except (ToolNotFoundError, OSError, subprocess.SubprocessError):
+        return None
+    lines = result.stdout.strip().splitlines()
+    return lines[0] if result.success and lines else None
+
+
+@lru_cache(maxsize=None)
+def _playwright_version() -> Optional[str]:
+    """Installed Playwright version (each release pins its Chromium build)"""
+    try:
+        return version('playwright')
+    except PackageNotFoundError:
+        return None
+
+
+def _default_metadata() -> Optional[Dict[str, Any]]:
+    """Defaults merged into documents lacking frontmatter fields"""
+    try:
+        from metadata import MetadataDefaults
+    except ImportError:
+        return None
+    return MetadataDefaults.get_defaults().to_dict()
+
+
+def _local_targets(source: bytes) -> List[bytes]:
+    """Referenced asset targets that aren't URLs"""
+    targets = _MD_IMAGE_RE.findall(source) + _HTML_ASSET_RE.findall(source)
+    if _REF_IMAGE_RE.search(source):
+        targets += _REF_DEFINITION_RE.findall(source)
+    return [t for t in targets if not _REMOTE_TARGET_RE.match(t.strip())]
+
+
+class OutputCache:
+    """
+    File-based cache of rendered documents under <cache_dir>/outputs/.
+
+    Only self-contained formats are cached: HTML output links SVG files
+    next to it, which a single cached file can't restore.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir) / 'outputs'
+
+    @staticmethod
+    def is_cacheable(source: bytes) -> bool:
+        """
+        Whether a document's output depends only on what the key covers.
+
+        Local images, stylesheets and other referenced files are read at
+        render time and aren't part of the key, so documents using them
+        are always rendered.
+        """
+        return not _local_targets(source)
+
+    def compute_key(
+        self,
+        source: bytes,
+        output_format: str,
+        options: Dict[str, Any]
+    ) -> str:
+        """
+        Compute the cache key for a conversion.
+
+        Args:
+            source: Markdown file contents
+            output_format: Output format ('pdf', 'docx', ...)
+            options: Pipeline configuration options
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        relevant = {}
+        for name, value in options.items():
+            if name in _IGNORED_OPTIONS:
+                continue
+            if name in _FILE_OPTIONS and value:
+                value = _file_state(value)
+            relevant[name] = value
+
+        profile = options.get('profile')
+        environment = {
+            'profile': _profile_state(profile) if profile else None,
+            'layout_css': _file_state(_LAYOUT_CSS),
+            'defaults': _default_metadata(),
+            'pandoc': _tool_version('pandoc'),
+            'playwright': _playwright_version(),
+            # mmdc only renders documents with Mermaid blocks
+            'mmdc': _tool_version('mmdc') if b'```mermaid' in source else None,
+        }
+
+        digest = hashlib.sha256(source)
+        digest.update(
+            json.dumps(
+                [CACHE_VERSION, output_format, relevant, environment],
+                sort_keys=True,
+                default=str
+            ).encode('utf-8')
+        )
+        return digest.hexdigest()
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / f'{key}{suffix}'
+
+    def restore(self, key: str, output_file: Path) -> bool:
+        """
+        Copy a cached output to output_file.
+
+        Returns:
+            True if the key was cached and copied, False otherwise
+        """
+        cached_file = self._path(key, output_file.suffix)
+        try:
+            shutil.copyfile(cached_file, output_file)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def store(self, key: str, output_file: Path) -> None:
+        """
+        Copy a freshly rendered output into the cache.
+
+        Failures (full disk, read-only cache dir) are ignored: the output
+        itself is already written.
+        """
+        cached_file = self._path(key, output_file.suffix)
+
+        # Copy under a private name and rename into place, so concurrent
+        # workers never read a partial file
+        tmp_file = cached_file.with_name(f'{cached_file.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_file, tmp_file)
+            os.replace(tmp_file, cached_file)
+        except OSError:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
@@ -3,8 +3,8 @@ Diagram rendering pipeline step - FULL MERMAID SUPPORT with Phase B Integration
 Integrated MermaidNativeRenderer (Phase B) for 40-60% performance improvement.
 """
 from pathlib import Path
+import os
 import re
-import tempfile
 import sys
 from typing import Optional, Tuple, List
 
@@ -13,6 +13,13 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from ..base import PipelineStep, PipelineContext, PipelineError
 
 
+# Seconds before a single mmdc render is abandoned
+MMDC_TIMEOUT = 30
+
+# ```mermaid fenced block, capturing the diagram source
+_MERMAID_BLOCK_RE = re.compile(r'```mermaid\s*\n(.*?)\n```', re.DOTALL)
+
+
 class DiagramRenderingStep(PipelineStep):
     """
     Render Mermaid diagrams to SVG and embed them inline in markdown.
@@ -187,75 +194,98 @@ class DiagramRenderingStep(PipelineStep):
         """
         Render using mermaid-cli (mmdc) subprocess as fallback.
         
+        Each distinct diagram is rendered once. Cached SVGs (keyed by diagram
+        source and theme) are reused, and the remaining mmdc processes run
+        concurrently.
+        
         Returns:
             (modified_markdown, rendered_count)
         """
-        import subprocess
-        import shutil
+        try:
+            from external_tools import MermaidCLI, ToolNotFoundError
+            from diagram_rendering import DiagramCache, DiagramFormat
+        except ImportError:
+            self.log("Mermaid CLI wrapper not available", context)
+            return markdown_content, 0
+        
+        try:
+            mmdc = MermaidCLI()
+        except ToolNotFoundError:
+            self.log("mmdc not found, cannot render diagrams", context)
+            return markdown_content, 0
         
-        result = markdown_content
-        rendered_count = 0
         profile = context.get_config('profile')
         theme = self._get_theme_for_profile(profile)
+        theme_config = context.get_config('theme_config')
+        cache_dir = context.get_config('cache_dir')
+        use_cache = context.get_config('use_cache', True)
         
-        # Find mmdc executable (Windows needs .cmd extension)
-        mmdc_exe = shutil.which('mmdc.cmd') or shutil.which('mmdc') or 'mmdc'
+        cache = DiagramCache(cache_dir) if use_cache and cache_dir else None
+        cache_options = {
+            'renderer': 'mmdc',
+            'theme': theme,
+            'theme_config': str(theme_config or ''),
+            # Edits to the theme JSON must not keep serving old SVGs
+            'theme_config_state': self._file_state(theme_config),
+        }
+        render_options = {
+            'theme': theme,
+            'background': 'transparent',
+            'theme_config': Path(theme_config) if theme_config else None,
+            'timeout': MMDC_TIMEOUT,
+        }
         
-        # Process diagrams in reverse order to maintain position indices
-        for idx, (start, end, code) in enumerate(reversed(diagram_blocks)):
-            actual_idx = len(diagram_blocks) - 1 - idx
-            svg_file = context.work_dir / f"diagram_{actual_idx:03d}.svg"
+        # Diagram source -> SVG file; repeated diagrams share one render
+        svg_files = {}
+        jobs = []
+        job_codes = []
+        for idx, (start, end, code) in enumerate(diagram_blocks):
+            if code in svg_files:
+                continue
+            svg_file = context.work_dir / f"diagram_{idx:03d}.svg"
+            svg_files[code] = svg_file
             
-            # Write diagram code to temp file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.mmd', delete=False) as f:
-                f.write(code)
-                mmd_file = Path(f.name)
+            if cache and cache.get_and_copy(code, svg_file, DiagramFormat.SVG, cache_options):
+                self.log(f"  ✓ Diagram {idx + 1}: Cache hit", context)
+                continue
             
-            try:
-                # Call mermaid-cli with puppeteer config for Docker (no-sandbox)
-                puppeteer_config = Path(__file__).parent.parent.parent / 'config' / 'puppeteer-config.json'
-                cmd = [
-                    mmdc_exe,
-                    '--input', str(mmd_file),
-                    '--output', str(svg_file),
-                    '--theme', theme,
-                    '--backgroundColor', 'transparent',
-                    '--puppeteerConfigFile', str(puppeteer_config)
-                ]
-                
-                # Windows needs shell=True for .cmd files
-                use_shell = mmdc_exe.endswith('.cmd')
-                proc_result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=30,
-                    shell=use_shell
-                )
-                
-                if proc_result.returncode == 0 and svg_file.exists():
-                    with open(svg_file, 'r', encoding='utf-8') as f:
-                        svg_content = f.read()
-                    
-                    svg_wrapper = f'''<div class="diagram-container" style="display: flex; justify-content: center; margin: 1.5em 0;">
-{svg_content}
-</div>'''
-                    
-                    # Find and replace the original block
-                    orig_start, orig_end, _ = diagram_blocks[actual_idx]
-                    result = result[:orig_start] + svg_wrapper + result[orig_end:]
-                    rendered_count += 1
-                    self.log(f"  ✓ Diagram {actual_idx + 1}: Rendered via mmdc", context)
-                else:
-                    self.log(f"  ✗ Diagram {actual_idx + 1}: mmdc failed", context)
+            mmd_file = context.work_dir / f"diagram_{idx:03d}.mmd"
+            mmd_file.write_bytes(code.encode('utf-8'))
+            context.temp_files.append(mmd_file)
+            jobs.append((mmd_file, svg_file, render_options))
+            job_codes.append(code)
+        
+        for code, (mmd_file, svg_file, _), proc_result in zip(job_codes, jobs, mmdc.render_many(jobs)):
+            if proc_result.success and svg_file.exists():
+                self.log(f"  ✓ {svg_file.name}: Rendered via mmdc", context)
+                if cache:
+                    cache.save(code, svg_file, DiagramFormat.SVG, cache_options)
+                    cache.record_miss(svg_file)
+            else:
+                # Don't embed a partial file from a failed render
+                svg_file.unlink(missing_ok=True)
+        
+        # Replace blocks in reverse order to maintain position indices
+        result = markdown_content
+        rendered_count = 0
+        svg_contents = {}
+        for idx in reversed(range(len(diagram_blocks))):
+            start, end, code = diagram_blocks[idx]
+            svg_file = svg_files[code]
+            
+            if code not in svg_contents:
+                svg_contents[code] = svg_file.read_text(encoding='utf-8') if svg_file.exists() else None
+            svg_content = svg_contents[code]
             
-            except Exception as e:
-                self.log(f"  ✗ Diagram {actual_idx + 1}: {e}", context)
+            if svg_content is None:
+                self.log(f"  ✗ Diagram {idx + 1}: mmdc failed", context)
+                continue
             
-            finally:
-                # Cleanup temp file
-                if mmd_file.exists():
-                    mmd_file.unlink()
+            svg_wrapper = f'''<div class="diagram-container" style="display: flex; justify-content: center; margin: 1.5em 0;">
+{svg_content}
+</div>'''
+            result = result[:start] + svg_wrapper + result[end:]
+            rendered_count += 1
         
         return result, rendered_count
     
@@ -267,9 +297,8 @@ class DiagramRenderingStep(PipelineStep):
             List of (start_pos, end_pos, code) tuples
         """
         blocks = []
-        pattern = r'```mermaid\s*\n(.*?)\n```'
         
-        for match in re.finditer(pattern, content, re.DOTALL):
+        for match in _MERMAID_BLOCK_RE.finditer(content):
             code = match.group(1).strip()
             if code:
                 blocks.append((match.start(), match.end(), code))
@@ -290,6 +319,17 @@ class DiagramRenderingStep(PipelineStep):
         
         return theme_map.get(profile, 'neutral')
     
+    @staticmethod
+    def _file_state(path: Optional[str]) -> Optional[Tuple[int, int]]:
+        """(size, mtime_ns) of a file, or None if unset or missing"""
+        if not path:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+    
     def _log_phase_b_metrics(self, context: PipelineContext) -> None:
         """
         Log Phase B performance metrics if available.
@@ -16,6 +16,10 @@ from typing import List, Tuple
 from ..base import PipelineStep, PipelineContext, PipelineError
 
 
+# <img ... src="..." ...>, capturing the attributes around src
+_IMG_SRC_RE = re.compile(r'<img\s+([^>]*?)src=["\']([^"\']*)["\']([^>]*)>', re.IGNORECASE)
+
+
 class ImagePathCorrectionStep(PipelineStep):
     """
     Correct relative image paths in HTML after Pandoc conversion.
@@ -28,21 +32,21 @@ class ImagePathCorrectionStep(PipelineStep):
     3. Browser needs correct path from HTML location to SVG files
     
     Processing:
-    1. Load generated HTML
+    1. Take generated HTML from context (in memory)
     2. Find all <img src=...> tags
     3. Verify SVG files exist in work_dir
     4. Fix paths to be relative to HTML file location
     5. Handle cases where paths are embedded data URIs (skip)
-    6. Write corrected HTML back
+    6. Store corrected HTML back on the context
     """
     
     def get_name(self) -> str:
         return "Image Path Correction"
     
     def validate(self, context: PipelineContext) -> None:
-        """Ensure HTML file exists"""
-        if not context.html_file:
-            raise PipelineError("HTML file not generated yet")
+        """Ensure HTML has been generated"""
+        if not context.html_content or not context.html_file:
+            raise PipelineError("HTML not generated yet")
     
     def execute(self, context: PipelineContext) -> bool:
         """
@@ -50,14 +54,10 @@ class ImagePathCorrectionStep(PipelineStep):
         """
         
         try:
+            # html_file is where the HTML lives (or will be written by the
+            # rendering step); relative image paths are computed against it.
             html_file = context.html_file
-            
-            if not html_file.exists():
-                self.log(f"HTML file not found: {html_file}", context)
-                return True  # Non-critical
-            
-            # Read HTML
-            html_content = html_file.read_text(encoding='utf-8')
+            html_content = context.html_content
             
             # Find all SVG files in work_dir
             svg_files = list(context.work_dir.glob("diagram_*.svg"))
@@ -75,8 +75,10 @@ class ImagePathCorrectionStep(PipelineStep):
             )
             
             if corrections_made > 0:
-                # Write corrected HTML
-                html_file.write_text(html_content, encoding='utf-8')
+                context.html_content = html_content
+                # Keep an already-written HTML file in sync
+                if html_file.exists():
+                    html_file.write_bytes(html_content.encode('utf-8'))
                 self.log(f"✓ Corrected {corrections_made} image path(s)", context)
             else:
                 self.log("No image paths needed correction", context)
@@ -98,9 +100,6 @@ class ImagePathCorrectionStep(PipelineStep):
         
         corrections = 0
         
-        # Pattern to find img tags: <img src="..." ...>
-        img_pattern = r'<img\s+([^>]*?)src=["\']([^"\']*)["\']([^>]*)>'
-        
         def replace_img_src(match):
             nonlocal corrections
             before_src = match.group(1)
@@ -131,7 +130,7 @@ class ImagePathCorrectionStep(PipelineStep):
             return match.group(0)  # Keep original if we can't find file
         
         # Replace all img src attributes
-        corrected_html = re.sub(img_pattern, replace_img_src, html_content, flags=re.IGNORECASE)
+        corrected_html = _IMG_SRC_RE.sub(replace_img_src, html_content)
         
         return corrected_html, corrections
     
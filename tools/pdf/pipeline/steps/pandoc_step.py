@@ -4,6 +4,7 @@ Markdown → HTML conversion with extensions.
 """
 import shutil
 from pathlib import Path
+from typing import Optional
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -31,12 +32,9 @@ class PandocConversionStep(PipelineStep):
     def execute(self, context: PipelineContext) -> bool:
         """Convert MD→HTML using PandocExecutor"""
         try:
-            # Write preprocessed markdown to temp file
-            tmp_md = context.work_dir / 'preprocessed.md'
-            tmp_md.write_text(context.preprocessed_markdown, encoding='utf-8')
-            context.temp_files.append(tmp_md)
-            
-            # Setup output file
+            # Markdown goes in via stdin and HTML comes back on stdout;
+            # the HTML file itself is only written later, by the rendering step.
+            markdown = context.preprocessed_markdown
             tmp_html = context.work_dir / 'output.html'
             
             # Get configuration
@@ -62,30 +60,27 @@ class PandocConversionStep(PipelineStep):
                     extra_args.extend(['--metadata', f'crossrefYaml={crossref_config}'])
                 
                 # Convert
-                success = pandoc.convert_markdown_to_html(
-                    tmp_md,
-                    tmp_html,
+                html = pandoc.convert_string_to_html(
+                    markdown,
                     extensions=extensions,
                     highlight_style=highlight_style,
                     resource_path=context.work_dir,
                     extra_args=extra_args if extra_args else None
                 )
                 
-                if not success:
+                if html is None:
                     raise PipelineError("Pandoc conversion returned failure")
                 
             except ImportError:
                 # Fallback to subprocess
                 self.log("Using legacy Pandoc subprocess", context)
-                success = self._legacy_convert(tmp_md, tmp_html, context)
+                html = self._legacy_convert(markdown, context)
                 
-                if not success:
+                if html is None:
                     raise PipelineError("Legacy Pandoc conversion failed")
             
-            # Read HTML content
-            context.html_content = tmp_html.read_text(encoding='utf-8')
+            context.html_content = html
             context.html_file = tmp_html
-            context.temp_files.append(tmp_html)
             
             self.log(f"Converted to HTML ({len(context.svg_files)} diagrams embedded)", context)
             return True
@@ -95,8 +90,8 @@ class PandocConversionStep(PipelineStep):
         except Exception as e:
             raise PipelineError(f"Pandoc conversion failed: {e}")
     
-    def _legacy_convert(self, input_file: Path, output_file: Path, context: PipelineContext) -> bool:
-        """Fallback to direct subprocess call"""
+    def _legacy_convert(self, markdown: str, context: PipelineContext) -> Optional[str]:
+        """Fallback to direct subprocess call (stdin → stdout)"""
         import subprocess
         
         pandoc_exe = shutil.which('pandoc') or 'pandoc'
@@ -104,8 +99,6 @@ class PandocConversionStep(PipelineStep):
         
         cmd = [
             pandoc_exe,
-            str(input_file),
-            '-o', str(output_file),
             '--standalone',
             '--highlight-style', highlight_style,
             '--from', 'markdown+yaml_metadata_block+raw_html+fenced_code_blocks+tables+pipe_tables',
@@ -122,9 +115,10 @@ class PandocConversionStep(PipelineStep):
                 cmd.extend(['--metadata', f'crossrefYaml={crossref_config}'])
         
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return True
+            result = subprocess.run(cmd, input=markdown, capture_output=True,
+                                    encoding='utf-8', check=True)
+            return result.stdout
         except subprocess.CalledProcessError as e:
             self.log(f"Pandoc error: {e.stderr}", context)
-            return False
+            return None
 
@@ -11,6 +11,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from ..base import PipelineStep, PipelineContext, PipelineError
 
 
+# Inline style attributes and <style> blocks removed by CSSStrippingStep
+_STYLE_ATTR_RE = re.compile(r'\s+style="[^"]*"')
+_STYLE_BLOCK_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL)
+
+# Opening <body> tag (with or without attributes); Pandoc emits it within the first few KB
+_BODY_OPEN_RE = re.compile(r'<body(?:\s[^>]*)?>')
+_BODY_SEARCH_WINDOW = 4096
+
+
 class CSSStrippingStep(PipelineStep):
     """
     Strip Pandoc's inline styles from HTML.
@@ -27,12 +36,18 @@ class CSSStrippingStep(PipelineStep):
             return True
         
         try:
-            # Remove inline style attributes
+            # Plain substring checks are far cheaper than the regexes; skip
+            # each pass when there is nothing for it to match (e.g. Pandoc
+            # ran without --standalone or with a style-free template).
             html = context.html_content
-            html = re.sub(r'\s+style="[^"]*"', '', html)
+            
+            # Remove inline style attributes
+            if 'style="' in html:
+                html = _STYLE_ATTR_RE.sub('', html)
             
             # Remove Pandoc's default <style> block
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL)
+            if '<style' in html:
+                html = _STYLE_BLOCK_RE.sub('', html)
             
             context.html_content = html
             
@@ -78,18 +93,15 @@ class TitlePageInjectionStep(PipelineStep):
             # Build title page HTML
             title_html = self._build_title_page(metadata, logo_path)
             
-            # Inject after <body>
-            if '<body>' in context.html_content:
-                context.html_content = context.html_content.replace(
-                    '<body>',
-                    f'<body>\n{title_html}'
-                )
-            elif '<body ' in context.html_content:
-                # Handle body with attributes
-                context.html_content = re.sub(
-                    r'(<body[^>]*>)',
-                    r'\1\n' + title_html,
-                    context.html_content
+            # Inject after the opening <body> tag (near the top of the document)
+            html = context.html_content
+            body_match = _BODY_OPEN_RE.search(html, 0, _BODY_SEARCH_WINDOW)
+            if not body_match and len(html) > _BODY_SEARCH_WINDOW:
+                body_match = _BODY_OPEN_RE.search(html)
+            if body_match:
+                insert_at = body_match.end()
+                context.html_content = ''.join(
+                    (html[:insert_at], '\n', title_html, html[insert_at:])
                 )
             
             self.log("Injected title page", context)
@@ -197,7 +209,7 @@ class MetadataInjectionStep(PipelineStep):
             
             # Write updated HTML to file if it exists
             if context.html_file and context.html_file.exists():
-                context.html_file.write_text(context.html_content, encoding='utf-8')
+                context.html_file.write_bytes(context.html_content.encode('utf-8'))
             
             self.log("Injected metadata as HTML meta tags", context)
             return True
@@ -3,8 +3,9 @@ Preprocessing pipeline steps.
 Read content, extract metadata, expand glossary, render math.
 """
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -12,6 +13,16 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from ..base import PipelineStep, PipelineContext, PipelineError
 
 
+# Fenced code blocks are matched as their own token so the single-pass
+# glossary and math scanners emit them verbatim instead of rewriting them.
+_CODE_FENCE_PATTERN = r'(?P<codefence>^(?P<fence>`{3,}|~{3,})[^\n]*\n.*?^(?P=fence)[ \t]*$)'
+
+# $$...$$ (display) and $...$ (inline) math, skipping fenced code blocks
+_MATH_TOKEN_RE = re.compile(
+    _CODE_FENCE_PATTERN + r'|\$\$(?P<display>[^\$]+)\$\$|\$(?P<inline>[^\$]+)\$',
+    re.MULTILINE | re.DOTALL
+)
+
 class ReadContentStep(PipelineStep):
     """
     Read raw markdown content from input file.
@@ -29,7 +40,9 @@ class ReadContentStep(PipelineStep):
     def execute(self, context: PipelineContext) -> bool:
         """Read markdown content from input file"""
         try:
-            context.raw_content = context.input_file.read_text(encoding='utf-8')
+            # Callers that already hold the text seed raw_content up front
+            if context.raw_content is None:
+                context.raw_content = context.input_file.read_text(encoding='utf-8')
             context.preprocessed_markdown = context.raw_content
             
             self.log(f"Read {len(context.raw_content)} characters", context)
@@ -156,31 +169,79 @@ class GlossaryExpansionStep(PipelineStep):
             return True  # Non-critical failure
     
     def _expand_glossary(self, content: str, glossary_path: Path) -> str:
-        """Inline glossary expansion"""
-        import yaml
+        """
+        Inline glossary expansion.
         
+        All terms are matched in a single pass over the document; the first
+        occurrence of each term (outside fenced code) gets its definition.
+        """
         try:
-            glossary = yaml.safe_load(glossary_path.read_text(encoding='utf-8'))
-            
-            if not glossary or 'terms' not in glossary:
+            compiled = _load_glossary_pattern(glossary_path)
+            if compiled is None:
                 return content
             
-            for term_def in glossary.get('terms', []):
-                term = term_def.get('term', '')
-                definition = term_def.get('definition', '')
-                
-                if term and definition:
-                    # Replace first occurrence with term + definition
-                    pattern = r'\b' + re.escape(term) + r'\b'
-                    replacement = f"{term} ({definition})"
-                    content = re.sub(pattern, replacement, content, count=1)
+            definitions, token_re = compiled
+            expanded = set()
             
-            return content
+            def replace_term(match):
+                term = match.group('term')
+                if term is None or term in expanded:
+                    return match.group(0)
+                # Replace first occurrence only
+                expanded.add(term)
+                return f"{term} ({definitions[term]})"
+            
+            return token_re.sub(replace_term, content)
             
         except Exception:
             return content
 
 
+def _load_glossary_pattern(glossary_path: Path) -> Optional[Tuple[Dict[str, str], 're.Pattern']]:
+    """
+    Parse a glossary file and compile its term scanner.
+    
+    Results are cached per (path, mtime) so a batch sharing one glossary
+    parses the YAML and builds the regex once.
+    
+    Returns:
+        (term -> definition, compiled pattern), or None if no usable terms
+    """
+    return _compile_glossary(str(glossary_path), glossary_path.stat().st_mtime_ns)
+
+
+# Bounded: each edit of a glossary is a new key, and long-lived processes
+# (web_demo) would otherwise keep every past version
+@lru_cache(maxsize=32)
+def _compile_glossary(path: str, mtime_ns: int) -> Optional[Tuple[Dict[str, str], 're.Pattern']]:
+    """Uncached body of _load_glossary_pattern(); mtime_ns is only a cache key."""
+    import yaml
+    
+    glossary = yaml.safe_load(Path(path).read_text(encoding='utf-8'))
+    
+    definitions = {}
+    if glossary and 'terms' in glossary:
+        for term_def in glossary.get('terms', []):
+            term = term_def.get('term', '')
+            definition = term_def.get('definition', '')
+            
+            if term and definition and term not in definitions:
+                definitions[term] = definition
+    
+    if not definitions:
+        return None
+    
+    # Longest terms first so "API Gateway" wins over "API"
+    alternation = '|'.join(
+        re.escape(term) for term in sorted(definitions, key=len, reverse=True)
+    )
+    token_re = re.compile(
+        _CODE_FENCE_PATTERN + r'|\b(?P<term>' + alternation + r')\b',
+        re.MULTILINE | re.DOTALL
+    )
+    return definitions, token_re
+
+
 class MathRenderingStep(PipelineStep):
     """
     Pre-render math equations with KaTeX.
@@ -209,40 +270,45 @@ class MathRenderingStep(PipelineStep):
                 self.log("KaTeX not available, skipping math rendering", context)
                 return True
             
+            markdown = context.preprocessed_markdown
+            
+            # Collect every distinct expression first so they can be rendered
+            # in one batch instead of one KaTeX round-trip per occurrence.
+            expressions = {}
+            for match in _MATH_TOKEN_RE.finditer(markdown):
+                if match.group('codefence') is not None:
+                    continue
+                display_math = match.group('display')
+                key = (display_math or match.group('inline'), display_math is not None)
+                expressions.setdefault(key, None)
+            
+            try:
+                keys = list(expressions)
+                expressions.update(zip(keys, katex.render_batch(keys)))
+            except Exception:
+                pass  # Unexpected failure: leave everything unrendered
+            
             # Count math expressions for logging
             math_count = 0
             
             def replace_math(match):
                 nonlocal math_count
-                display_math = match.group(1)
-                inline_math = match.group(2)
+                if match.group('codefence') is not None:
+                    return match.group(0)
                 
+                display_math = match.group('display')
                 is_display = display_math is not None
-                math_code = display_math or inline_math
+                html = expressions.get((display_math or match.group('inline'), is_display))
                 
-                try:
-                    if is_display:
-                        html = katex.render_display(math_code)
-                    else:
-                        html = katex.render_inline(math_code)
-                    
-                    if html:
-                        math_count += 1
-                        tag = 'div' if is_display else 'span'
-                        cls = 'math-display' if is_display else 'math-inline'
-                        return f'<{tag} class="{cls}">{html}</{tag}>'
-                except Exception:
-                    pass
+                if html:
+                    math_count += 1
+                    tag = 'div' if is_display else 'span'
+                    cls = 'math-display' if is_display else 'math-inline'
+                    return f'<{tag} class="{cls}">{html}</{tag}>'
                 
                 return match.group(0)
             
-            # Match $$...$$ (display) and $...$ (inline)
-            pattern = r'\$\$([^\$]+)\$\$|\$([^\$]+)\$'
-            context.preprocessed_markdown = re.sub(
-                pattern,
-                replace_math,
-                context.preprocessed_markdown
-            )
+            context.preprocessed_markdown = _MATH_TOKEN_RE.sub(replace_math, markdown)
             
             self.log(f"Rendered {math_count} math equations", context)
             return True
@@ -33,7 +33,7 @@ class PdfRenderingStep(PipelineStep):
             if not context.html_file or not context.html_file.exists():
                 # Write HTML content to temp file
                 context.html_file = context.work_dir / 'output.html'
-                context.html_file.write_text(context.html_content, encoding='utf-8')
+                context.html_file.write_bytes(context.html_content.encode('utf-8'))
                 context.temp_files.append(context.html_file)
             
             # Try new architecture first
@@ -49,13 +49,11 @@ class PdfRenderingStep(PipelineStep):
                     raise PipelineError("Playwright renderer not available. Install with: pip install playwright && playwright install chromium")
                 
                 # Handle profile - load CSS from profile if no explicit css_file provided
+                profile_name = context.get_config('profile')
                 css_file = context.get_config('css_file')
                 if not css_file:
-                    profile_name = context.get_config('profile')
                     if profile_name:
                         try:
-                            import sys
-                            from pathlib import Path
                             # Add tools/pdf directory to path for imports
                             pdf_tools_dir = Path(__file__).parent.parent.parent
                             if str(pdf_tools_dir) not in sys.path:
@@ -139,7 +137,7 @@ class DocxRenderingStep(PipelineStep):
         try:
             # Write preprocessed markdown to temp file
             tmp_md = context.work_dir / 'preprocessed.md'
-            tmp_md.write_text(context.preprocessed_markdown, encoding='utf-8')
+            tmp_md.write_bytes(context.preprocessed_markdown.encode('utf-8'))
             context.temp_files.append(tmp_md)
             
             # Try new architecture first
@@ -234,7 +232,7 @@ class HtmlRenderingStep(PipelineStep):
                     )
             
             # Write output
-            context.output_file.write_text(context.html_content, encoding='utf-8')
+            context.output_file.write_bytes(context.html_content.encode('utf-8'))
             
             # Copy SVG files to output directory
             output_dir = context.output_file.parent
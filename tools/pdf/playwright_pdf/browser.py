@@ -4,6 +4,7 @@ Browser Lifecycle Management
 Handles Playwright browser initialization and page loading.
 Zero logic about diagrams, scaling, or PDF generation.
 """
+import asyncio
 from pathlib import Path
 from typing import Optional
 from playwright.async_api import async_playwright, Browser, Page
@@ -45,12 +46,113 @@ PDF_PAGE_SIZES = {
 }
 
 
+# Relaunch the shared browser after this many pages to bound Chromium's memory
+BROWSER_RECYCLE_PAGES = 100
+
+
+class _SharedBrowser:
+    """
+    One Chromium instance reused by every shared open_page() call.
+    
+    Playwright objects are bound to the event loop that created them, so
+    the browser is only reused while callers stay on that loop (see
+    renderers.playwright_wrapper, which keeps one loop per process).
+    """
+    
+    def __init__(self):
+        self._loop = None
+        self._lock = None
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._pages = 0
+        self._in_use = 0
+    
+    async def acquire(self, verbose: bool = False) -> Browser:
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Objects from another (finished) loop can't be used or closed here
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._playwright = self._browser = None
+            self._pages = self._in_use = 0
+        
+        async with self._lock:
+            stale = self._browser is not None and (
+                not self._browser.is_connected()
+                or (self._pages >= BROWSER_RECYCLE_PAGES and not self._in_use)
+            )
+            if stale:
+                await self.close()
+            
+            if self._browser is None:
+                if verbose:
+                    print(f"{INFO} Launching shared Chromium browser (Phase A optimizations enabled)...")
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True,
+                    args=PLAYWRIGHT_OPTIMIZATION_FLAGS,
+                )
+                self._pages = 0
+            
+            self._pages += 1
+            self._in_use += 1
+            return self._browser
+    
+    def release(self) -> None:
+        self._in_use -= 1
+    
+    async def close(self) -> None:
+        """Close the browser and stop Playwright (safe to call when idle)."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = self._browser = None
+        self._pages = 0
+
+
+_shared_browser = _SharedBrowser()
+
+
+async def close_shared_browser() -> None:
+    """Shut down the browser kept alive by open_page(shared=True)."""
+    await _shared_browser.close()
+
+
+def _context_args(page_format: str, color_scheme: Optional[str]) -> dict:
+    """Browser context options: viewport matching the PDF page size, fixed locale/timezone."""
+    context_args = {
+        'viewport': PDF_PAGE_SIZES.get(page_format, PDF_PAGE_SIZES['A4']),
+        'timezone_id': 'UTC',
+        'locale': 'en-US',
+    }
+    
+    # Only set color_scheme if explicitly specified (None = let CSS decide)
+    if color_scheme is not None:
+        context_args['color_scheme'] = color_scheme
+    return context_args
+
+
+async def _load_html(page: Page, html_file: Path, verbose: bool) -> None:
+    html_path = html_file.absolute()
+    file_url = f"file:///{str(html_path).replace(chr(92), '/')}"
+    
+    if verbose:
+        print(f"{INFO} Loading HTML: {file_url}")
+    
+    await page.goto(file_url, wait_until='networkidle', timeout=30000)
+
+
 @asynccontextmanager
 async def open_page(
     html_file: Path, 
     verbose: bool = False,
     page_format: str = 'A4',
     color_scheme: Optional[str] = None,  # None = let CSS @media queries decide
+    shared: bool = False,
 ):
     """
     Open a Playwright page and load the HTML file with Phase A optimizations.
@@ -71,11 +173,27 @@ async def open_page(
         verbose: Enable verbose logging
         page_format: PDF page format ('A4', 'Letter', 'Legal')
         color_scheme: Force color scheme ('dark', 'light') or None to let CSS decide
+        shared: Reuse one long-lived browser (see _SharedBrowser) and only
+                open a fresh context per call, instead of launching Chromium
     
     Usage:
         async with open_page(html_file, verbose=True) as (browser, page):
             # use page here
     """
+    if shared:
+        browser = await _shared_browser.acquire(verbose)
+        try:
+            context = await browser.new_context(**_context_args(page_format, color_scheme))
+            try:
+                page = await context.new_page()
+                await _load_html(page, html_file, verbose)
+                yield browser, page
+            finally:
+                await context.close()
+        finally:
+            _shared_browser.release()
+        return
+    
     browser = None
     async with async_playwright() as playwright:
         if verbose:
@@ -90,17 +208,7 @@ async def open_page(
         viewport = PDF_PAGE_SIZES.get(page_format, PDF_PAGE_SIZES['A4'])
         
         # Create context - color_scheme=None lets CSS @media queries work
-        context_args = {
-            'viewport': viewport,
-            'timezone_id': 'UTC',
-            'locale': 'en-US',
-        }
-        
-        # Only set color_scheme if explicitly specified (None = let CSS decide)
-        if color_scheme is not None:
-            context_args['color_scheme'] = color_scheme
-        
-        context = await browser.new_context(**context_args)
+        context = await browser.new_context(**_context_args(page_format, color_scheme))
         
         page = await context.new_page()
         
@@ -113,13 +221,7 @@ async def open_page(
                 print(f"{INFO} Color scheme: auto (CSS @media queries)")
         
         # Load HTML file
-        html_path = html_file.absolute()
-        file_url = f"file:///{str(html_path).replace(chr(92), '/')}"
-        
-        if verbose:
-            print(f"{INFO} Loading HTML: {file_url}")
-        
-        await page.goto(file_url, wait_until='networkidle', timeout=30000)
+        await _load_html(page, html_file, verbose)
         
         try:
             yield browser, page
@@ -72,6 +72,9 @@ class PdfGenerationConfig:
     # Profile name for theme detection (e.g., 'dark-pro', 'enterprise-blue')
     profile: Optional[str] = None
     
+    # Render in the process-wide shared browser instead of launching Chromium
+    reuse_browser: bool = False
+    
     @property
     def cover(self) -> CoverConfig:
         """Get cover page configuration"""
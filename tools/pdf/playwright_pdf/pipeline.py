@@ -69,6 +69,7 @@ async def generate_pdf(config: PdfGenerationConfig) -> bool:
             verbose=config.verbose,
             page_format=config.page_format,
             color_scheme=browser_color_scheme,  # Set based on profile theme
+            shared=config.reuse_browser,
         ) as (browser, page):
             # Extract metadata from HTML meta tags (always extract, fill in missing fields)
             # This ensures frontmatter like classification, version, type are captured
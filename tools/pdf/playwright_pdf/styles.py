@@ -8,6 +8,8 @@ from pathlib import Path
 from typing import List, Optional
 from playwright.async_api import Page
 
+from .utils import read_css
+
 try:
     from colorama import Fore, Style, init as colorama_init
     colorama_init(autoreset=True)
@@ -96,10 +98,8 @@ async def inject_custom_css(page: Page, css_file: str, verbose: bool = False) ->
     """
     Inject custom CSS from file.
     """
-    from pathlib import Path
-    css_path = Path(css_file)
-    if css_path.exists():
-        css_content = css_path.read_text(encoding='utf-8')
+    css_content = read_css(Path(css_file))
+    if css_content is not None:
         await page.add_style_tag(content=css_content)
         if verbose:
             print(f"{INFO} Loaded custom CSS: {css_file}")
@@ -2,7 +2,7 @@
 Shared utilities for Playwright PDF generation.
 Centralizes common logic to avoid duplication.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 import re
 
@@ -33,6 +33,29 @@ def filter_placeholder(value: Optional[str], default: str = '') -> str:
     return value
 
 
+# (path, mtime_ns) -> CSS text; one stylesheet is consulted several times per render
+_CSS_CACHE: Dict[Tuple[str, int], str] = {}
+
+
+def read_css(css_file: Path) -> Optional[str]:
+    """
+    Read a CSS file, reusing the text while the file is unchanged.
+    
+    Returns None if the file does not exist.
+    """
+    try:
+        mtime = css_file.stat().st_mtime_ns
+    except OSError:
+        return None
+    
+    key = (str(css_file), mtime)
+    css_content = _CSS_CACHE.get(key)
+    if css_content is None:
+        css_content = css_file.read_text(encoding='utf-8')
+        _CSS_CACHE[key] = css_content
+    return css_content
+
+
 def extract_margins_from_css(css_file: Path) -> Optional[Dict[str, str]]:
     """
     Extract @page margin values from a CSS file, excluding pseudo-selectors.
@@ -48,11 +71,13 @@ def extract_margins_from_css(css_file: Path) -> Optional[Dict[str, str]]:
     Returns dict like {'top': '2cm', 'right': '1.8cm', 'bottom': '2cm', 'left': '1.8cm'}
     or None if not found.
     """
-    if not css_file or not css_file.exists():
+    if not css_file:
         return None
     
     try:
-        css_content = css_file.read_text(encoding='utf-8')
+        css_content = read_css(css_file)
+        if css_content is None:
+            return None
         
         # Find @page rule (NOT @page:first, NOT @page:left, etc.)
         # Use negative lookahead to exclude pseudo-selectors
@@ -110,11 +135,13 @@ def extract_background_color(css_file: Optional[Path] = None, default: str = '#f
     Returns:
         Background color as hex string
     """
-    if not css_file or not css_file.exists():
+    if not css_file:
         return default
     
     try:
-        css_content = css_file.read_text(encoding='utf-8')
+        css_content = read_css(css_file)
+        if css_content is None:
+            return default
         
         # Priority 1: CSS variable --color-background-page
         match = re.search(r'--color-background-page\s*:\s*([^;]+);', css_content)
@@ -162,24 +189,23 @@ def detect_dark_mode(profile_name: Optional[str] = None, css_file: Optional[Path
             return True
         
         # Check CSS content for dark backgrounds
-        if css_file.exists():
-            try:
-                css_content = css_file.read_text(encoding='utf-8')
-                
-                # Look for dark background colors on body/html
-                # Common dark theme patterns: #0f172a, #1a1a1a, #000, rgb(0-50, 0-50, 0-50)
-                dark_bg_patterns = [
-                    r'(?:body|html)\s*\{[^}]*background(?:-color)?\s*:\s*#(?:0[0-9a-f]{5}|1[0-9a-f]{5}|[0-2][0-9a-f]{4})',  # #0xxxxx, #1xxxxx
-                    r'(?:body|html)\s*\{[^}]*background(?:-color)?\s*:\s*rgb\s*\(\s*[0-4][0-9]?\s*,',  # rgb(0-49, ...)
-                    r'--color-bg-page\s*:\s*#(?:0[0-9a-f]{5}|1[0-9a-f]{5})',  # CSS variable with dark color
-                ]
-                
-                for pattern in dark_bg_patterns:
-                    if re.search(pattern, css_content, re.IGNORECASE):
-                        return True
-                        
-            except Exception:
-                pass  # Fallback to False if CSS can't be read
+        try:
+            css_content = read_css(css_file)
+        except Exception:
+            css_content = None  # Fallback to False if CSS can't be read
+        
+        if css_content:
+            # Look for dark background colors on body/html
+            # Common dark theme patterns: #0f172a, #1a1a1a, #000, rgb(0-50, 0-50, 0-50)
+            dark_bg_patterns = [
+                r'(?:body|html)\s*\{[^}]*background(?:-color)?\s*:\s*#(?:0[0-9a-f]{5}|1[0-9a-f]{5}|[0-2][0-9a-f]{4})',  # #0xxxxx, #1xxxxx
+                r'(?:body|html)\s*\{[^}]*background(?:-color)?\s*:\s*rgb\s*\(\s*[0-4][0-9]?\s*,',  # rgb(0-49, ...)
+                r'--color-bg-page\s*:\s*#(?:0[0-9a-f]{5}|1[0-9a-f]{5})',  # CSS variable with dark color
+            ]
+            
+            for pattern in dark_bg_patterns:
+                if re.search(pattern, css_content, re.IGNORECASE):
+                    return True
     
     return False
 
@@ -20,7 +20,7 @@ from playwright_pdf.cli import main as cli_main
 # Re-export key functions for programmatic use
 from playwright_pdf.pipeline import generate_pdf
 from playwright_pdf.config import PdfGenerationConfig
-from playwright_pdf.browser import open_page
+from playwright_pdf.browser import open_page, close_shared_browser
 from playwright_pdf.dom_analyzer import analyze_layout
 from playwright_pdf.layout_transformer import compute_scaling, apply_scaling
 from playwright_pdf.styles import inject_fonts, inject_pagination_css
@@ -62,7 +62,7 @@ async def generate_pdf_from_html(
     organization=None, date=None, logo_path=None,
     generate_toc=False, generate_cover=False,
     watermark=None, css_file=None, page_format='A4', verbose=False,
-    version=None, doc_type=None, classification=None
+    version=None, doc_type=None, classification=None, reuse_browser=False
 ):
     """
     Legacy function for backward compatibility.
@@ -85,7 +85,8 @@ async def generate_pdf_from_html(
         watermark=watermark,
         css_file=Path(css_file) if css_file else None,
         page_format=page_format,
-        verbose=verbose
+        verbose=verbose,
+        reuse_browser=reuse_browser
     )
     
     return await generate_pdf(config)
@@ -113,7 +114,8 @@ async def batch_generate_pdfs(html_files, output_dir, common_options=None, verbo
         config = PdfGenerationConfig(
             html_file=Path(html_file),
             pdf_file=Path(pdf_file),
-            verbose=verbose
+            verbose=verbose,
+            reuse_browser=True
         )
         
         if common_options:
@@ -127,15 +129,18 @@ async def batch_generate_pdfs(html_files, output_dir, common_options=None, verbo
         success = await generate_pdf(config)
         return (html_file, success)
     
-    # Process in batches of 3 (Chromium is memory-intensive)
+    # Process in batches of 3 (Chromium is memory-intensive), all in one browser
     results = []
-    for i in range(0, len(html_files), 3):
-        batch = html_files[i:i+3]
-        batch_results = await asyncio.gather(*[generate_single(f) for f in batch])
-        results.extend(batch_results)
-        
-        completed = i + len(batch)
-        print(f"[INFO] Progress: {completed}/{len(html_files)} PDFs generated")
+    try:
+        for i in range(0, len(html_files), 3):
+            batch = html_files[i:i+3]
+            batch_results = await asyncio.gather(*[generate_single(f) for f in batch])
+            results.extend(batch_results)
+            
+            completed = i + len(batch)
+            print(f"[INFO] Progress: {completed}/{len(html_files)} PDFs generated")
+    finally:
+        await close_shared_browser()
     
     # Summary
     print(f"\n[INFO] Batch Generation Summary:")
@@ -3,6 +3,9 @@ Playwright PDF renderer wrapper.
 Delegates to existing playwright_renderer.py for backward compatibility.
 """
 import asyncio
+import multiprocessing.util
+import os
+import threading
 from .base import PdfRenderer, RenderError
 from .config import RenderConfig
 
@@ -15,6 +18,66 @@ except ImportError:
     pass
 
 
+# Event loop kept for the life of the process on its own thread, so the
+# shared Chromium launched by the first render() is reused by every later
+# one. Callers on any thread (e.g. a threaded Flask server) submit to it.
+_loop = None
+_loop_thread = None
+_loop_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """A forked child inherits the loop but not the thread running it."""
+    global _loop, _loop_thread, _loop_lock
+    _loop = _loop_thread = None
+    _loop_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _get_loop():
+    """Start this process's event loop thread on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name='playwright-loop', daemon=True
+            )
+            thread.start()
+            _loop, _loop_thread = loop, thread
+            # Unlike atexit, multiprocessing finalizers also run when a batch
+            # worker process exits, so each worker's browser is shut down too
+            multiprocessing.util.Finalize(None, _shutdown, exitpriority=0)
+        return _loop
+
+
+def _run(coro):
+    """Run a coroutine on the shared event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def _shutdown() -> None:
+    """Close the shared browser and stop the event loop at process exit."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        loop, _loop = _loop, None
+        thread, _loop_thread = _loop_thread, None
+    if loop is None:
+        return
+    try:
+        from playwright_pdf.browser import close_shared_browser
+        asyncio.run_coroutine_threadsafe(close_shared_browser(), loop).result(timeout=30)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
+
+
 class PlaywrightRenderer(PdfRenderer):
     """
     PDF renderer using Playwright (Chromium).
@@ -75,9 +138,9 @@ class PlaywrightRenderer(PdfRenderer):
                 # Try alternative import path
                 from .playwright_renderer import generate_pdf_from_html
             
-            # Call existing Playwright renderer (async)
+            # Call existing Playwright renderer (async) in the shared browser
             # Pass subtitle via custom_options since the function signature doesn't include it
-            success = asyncio.run(generate_pdf_from_html(
+            success = _run(generate_pdf_from_html(
                 html_file=str(config.html_file),
                 pdf_file=str(config.output_file),
                 title=config.title,
@@ -93,7 +156,8 @@ class PlaywrightRenderer(PdfRenderer):
                 watermark=config.watermark,
                 css_file=str(config.css_file) if config.css_file else None,
                 verbose=config.verbose,
-                subtitle=getattr(config, 'subtitle', None)
+                subtitle=getattr(config, 'subtitle', None),
+                reuse_browser=True
             ))
             
             if success:
@@ -240,6 +240,48 @@ author: Charlie
 except Exception as e:
     print(f"[ERROR] {e}")
 
+print("\n[TEST 9] MetadataExtractor.extract_from_file() Caching")
+print("-" * 70)
+
+try:
+    import tempfile
+    from metadata import MetadataExtractor
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        md_file = Path(tmp_dir) / "doc.md"
+        md_file.write_text("---\ntitle: First\n---\nBody", encoding='utf-8')
+        extractor = MetadataExtractor()
+        
+        frontmatter, content = extractor.extract_from_file(md_file)
+        frontmatter['title'] = 'Mutated'
+        frontmatter, content = extractor.extract_from_file(md_file)
+        assert frontmatter == {'title': 'First'}, "Cached result is not shared with callers"
+        assert content == 'Body', "Content returned from cache"
+        
+        md_file.write_text("---\ntitle: Second!\n---\nBody", encoding='utf-8')
+        os.utime(md_file, ns=(0, 0))
+        frontmatter, _ = extractor.extract_from_file(md_file)
+        assert frontmatter == {'title': 'Second!'}, "Edited file is parsed again"
+    print("[OK] extract_from_file() memoizes per file version")
+    
+except Exception as e:
+    print(f"[ERROR] {e}")
+
+print("\n[TEST 10] MetadataExtractor YAML Loader")
+print("-" * 70)
+
+try:
+    import yaml
+    from metadata.extractor import _SafeLoader
+    
+    if os.environ.get('CI'):
+        # Deployment images are expected to ship PyYAML with libyaml
+        assert _SafeLoader is yaml.CSafeLoader, "PyYAML built without libyaml (CSafeLoader missing)"
+    print(f"[OK] Frontmatter parsed with {_SafeLoader.__name__}")
+    
+except Exception as e:
+    print(f"[ERROR] {e}")
+
 # Summary
 print("\n" + "=" * 70)
 print("TEST SUITE COMPLETE")
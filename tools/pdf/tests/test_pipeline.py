@@ -10,6 +10,7 @@ Tests:
 5. Factory functions
 6. End-to-end pipeline execution
 """
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -137,6 +138,7 @@ try:
     
     step = TestStep()
     assert step.get_name() == "Test Step", "get_name works"
+    assert step.name == "Test Step", "name property caches get_name()"
     print("[OK] Custom step implementation works")
 
 except Exception as e:
@@ -257,6 +259,17 @@ try:
     step = pipeline.get_step("A")
     assert step is not None, "get_step works"
     print("[OK] get_step() works")
+    
+    # Lookups still see steps added to the public list directly
+    pipeline.steps.insert(0, SimpleStep("Z"))
+    assert pipeline.get_step("Z") is pipeline.steps[0], "get_step sees direct edits"
+    assert pipeline.get_step("A") is pipeline.steps[1], "get_step index refreshed"
+    
+    # Overwriting a step in place still resolves to the first match
+    duplicate = SimpleStep("C")
+    pipeline.steps[0] = duplicate
+    assert pipeline.get_step("C") is duplicate, "get_step returns the first match"
+    print("[OK] get_step() follows direct edits to steps")
 
 except Exception as e:
     print(f"[ERROR] {e}")
@@ -408,6 +421,146 @@ This is a test.
 except Exception as e:
     print(f"[ERROR] {e}")
 
+# Test 11: GlossaryExpansionStep
+print("\n[TEST 11] GlossaryExpansionStep Single-Pass Expansion")
+print("-" * 70)
+
+try:
+    step = GlossaryExpansionStep()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        glossary_file = Path(tmp_dir) / "glossary.yaml"
+        glossary_file.write_text(
+            "terms:\n"
+            "  - term: API\n"
+            "    definition: Application Programming Interface\n"
+            "  - term: API Gateway\n"
+            "    definition: Edge router\n",
+            encoding='utf-8'
+        )
+        
+        content = "The API Gateway fronts it.\n\n```python\nAPI = 1\n```\n\nThe API is here. API again.\n"
+        expanded = step._expand_glossary(content, glossary_file)
+        
+        assert "API Gateway (Edge router)" in expanded, "Longest term matched first"
+        assert "API = 1" in expanded, "Fenced code left untouched"
+        assert "The API (Application Programming Interface) is here. API again." in expanded, \
+            "Only first occurrence expanded"
+        print("[OK] GlossaryExpansionStep expands terms in one pass, skipping code fences")
+
+except Exception as e:
+    print(f"[ERROR] {e}")
+
+# Test 12: PdfRenderingStep with an explicit CSS file
+print("\n[TEST 12] PdfRenderingStep With Explicit CSS File")
+print("-" * 70)
+
+try:
+    from renderers import RendererFactory, RendererType, PdfRenderer
+    
+    rendered_configs = []
+    
+    class RecordingRenderer(PdfRenderer):
+        def get_name(self):
+            return "Recording"
+        
+        def is_available(self):
+            return True
+        
+        def render(self, config):
+            rendered_configs.append(config)
+            return True
+    
+    RendererFactory._init_renderers()
+    saved_renderer = RendererFactory._RENDERERS.get(RendererType.PLAYWRIGHT)
+    RendererFactory._RENDERERS[RendererType.PLAYWRIGHT] = RecordingRenderer
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            css_file = Path(tmp_dir) / "custom.css"
+            css_file.write_text("body { color: black; }", encoding='utf-8')
+            
+            context = PipelineContext(
+                input_file=Path(tmp_dir) / "test.md",
+                output_file=Path(tmp_dir) / "test.pdf",
+                work_dir=Path(tmp_dir),
+                html_content="<html><body>Hi</body></html>",
+                config={'css_file': str(css_file), 'profile': 'dark-pro'}
+            )
+            
+            success = PdfRenderingStep().execute(context)
+            
+            assert success, "PdfRenderingStep should succeed"
+            assert len(rendered_configs) == 1, "Renderer called once"
+            assert rendered_configs[0].css_file == css_file, "Explicit CSS file used"
+            assert rendered_configs[0].profile == 'dark-pro', "Profile passed to renderer"
+            print("[OK] PdfRenderingStep renders with an explicit CSS file and profile")
+    finally:
+        if saved_renderer is None:
+            RendererFactory._RENDERERS.pop(RendererType.PLAYWRIGHT, None)
+        else:
+            RendererFactory._RENDERERS[RendererType.PLAYWRIGHT] = saved_renderer
+
+except Exception as e:
+    print(f"[ERROR] {e}")
+
+print("\n[TEST 13] Whole-Document Output Cache")
+print("-" * 70)
+
+try:
+    from pipeline import process_document, OutputFormat
+    from pipeline.output_cache import OutputCache
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        md_file = tmp / "doc.md"
+        md_file.write_text("# Cached\n", encoding='utf-8')
+        css_file = tmp / "style.css"
+        css_file.write_text("body {}", encoding='utf-8')
+        
+        cache = OutputCache(tmp / "cache")
+        options = {'css_file': str(css_file), 'profile': 'dark-pro', 'verbose': False}
+        key = cache.compute_key(md_file.read_bytes(), 'pdf', options)
+        
+        assert key == cache.compute_key(md_file.read_bytes(), 'pdf', dict(options, verbose=True)), \
+            "Logging options don't affect the key"
+        assert key != cache.compute_key(md_file.read_bytes(), 'docx', options), "Format is part of the key"
+        assert key != cache.compute_key(b"# Changed\n", 'pdf', options), "Source is part of the key"
+        
+        rendered = tmp / "rendered.pdf"
+        rendered.write_bytes(b"%PDF-cached")
+        cache.store(key, rendered)
+        
+        # A cache hit copies the stored output without running the pipeline
+        output_file = tmp / "out.pdf"
+        success = process_document(
+            str(md_file), str(output_file), OutputFormat.PDF,
+            cache_dir=str(tmp / "cache"), cache_outputs=True, **options
+        )
+        assert success, "Cache hit should succeed"
+        assert output_file.read_bytes() == b"%PDF-cached", "Cached output restored"
+        
+        # Touching a referenced file invalidates the entry
+        os.utime(css_file, ns=(0, 0))
+        assert key != cache.compute_key(md_file.read_bytes(), 'pdf', options), "CSS mtime is part of the key"
+        
+        # The profile's stylesheet is keyed by mtime, not just its name
+        from pipeline.output_cache import _profile_state
+        assert _profile_state('dark-pro')['css'][0].endswith('dark-pro.css'), "Profile CSS is part of the key"
+        
+        # Documents referencing local files are never served from the cache
+        assert OutputCache.is_cacheable(b"# Doc\n![logo](https://example.com/a.png)\n"), "Remote images are fine"
+        assert not OutputCache.is_cacheable(b"# Doc\n![logo](images/a.png)\n"), "Local images disable caching"
+        assert not OutputCache.is_cacheable(b'<img src="a.svg">'), "Local HTML images disable caching"
+        
+        # A cache dir that can't be written doesn't fail the conversion
+        (tmp / "blocked").write_text("not a directory", encoding='utf-8')
+        OutputCache(tmp / "blocked").store(key, rendered)
+        print("[OK] Unchanged documents are served from the output cache")
+
+except Exception as e:
+    print(f"[ERROR] {e}")
+
 # Summary
 print("\n" + "=" * 70)
 print("TEST SUITE COMPLETE")
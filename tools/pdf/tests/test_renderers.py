@@ -164,6 +164,72 @@ except ImportError:
 except Exception as e:
     print(f"[ERROR] {e}")
 
+# Test 6b: PlaywrightRenderer from several threads
+print("\n[TEST 6b] PlaywrightRenderer Concurrent Threads")
+print("-" * 70)
+
+try:
+    import asyncio
+    import tempfile
+    import threading
+    import types
+    from renderers import PlaywrightRenderer
+    
+    if PlaywrightRenderer:
+        # Stand-in for the Chromium renderer: both calls must be in flight
+        # on the shared event loop at the same time
+        in_flight = []
+        overlapped = threading.Event()
+        
+        async def fake_generate_pdf_from_html(**kwargs):
+            in_flight.append(kwargs['pdf_file'])
+            if len(in_flight) == 2:
+                overlapped.set()
+            for _ in range(200):
+                if overlapped.is_set():
+                    break
+                await asyncio.sleep(0.01)
+            return True
+        
+        fake_module = types.ModuleType('renderers.playwright_renderer')
+        fake_module.generate_pdf_from_html = fake_generate_pdf_from_html
+        saved_module = sys.modules.get('renderers.playwright_renderer')
+        sys.modules['renderers.playwright_renderer'] = fake_module
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                html_file = Path(tmp) / 'doc.html'
+                html_file.write_text('<html></html>')
+                results = {}
+                
+                def render_in_thread(name):
+                    try:
+                        results[name] = PlaywrightRenderer().render(RenderConfig(
+                            html_file=html_file,
+                            output_file=Path(tmp) / f'{name}.pdf'
+                        ))
+                    except Exception as e:
+                        results[name] = e
+                
+                threads = [threading.Thread(target=render_in_thread, args=(n,)) for n in ('a', 'b')]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join(timeout=10)
+        finally:
+            if saved_module is not None:
+                sys.modules['renderers.playwright_renderer'] = saved_module
+            else:
+                del sys.modules['renderers.playwright_renderer']
+        
+        assert results == {'a': True, 'b': True}, f"Concurrent renders failed: {results}"
+        assert overlapped.is_set(), "Renders did not run concurrently"
+        print("[OK] render() from two threads at once shares one event loop")
+    else:
+        print("[WARN] PlaywrightRenderer not available")
+        
+except Exception as e:
+    print(f"[ERROR] {e}")
+
 # Test 7: Fallback chain
 print("\n[TEST 7] Renderer Fallback Chain")
 print("-" * 70)